@@ -1,15 +1,35 @@
-from src.linkedinAutomation import login, search, filter_recruiters, goto_next_page
-from src.html_parser import HTMLProcessor
+from src.linkedinAutomation import (new_session_context, ensure_logged_in, apply_scraping_profile,
+                                    launch_daemon_context, connect_to_daemon,
+                                    open_people_search, goto_next_page, listen_for_search_results,
+                                    known_fraction, read_page_count, last_page_reached, results_page_url,
+                                    start_results_page, wait_for_results)
+from src.html_parser import HTMLProcessor, DOM_EXTRACTION_SCRIPT
 from src.pdf_parser import PDFProcessor
-from src.excelhandler import save_recruiter_data, get_mails_from_apollo
+from src.voyager_parser import VoyagerProcessor
+from src.excelhandler import save_recruiter_data, get_mails_from_apollo, load_known_recruiters
 from src.emailDraftManager import generate_company_drafts
 from src.emailSender import GmailSender
+from src.pageCorpus import PageCorpus
+from src.scrapeCheckpoint import ScrapeCheckpoint
+from src.sendJournal import SendJournal
+from src.recruiterStore import recruiter_store
+from src.config import (IN_MEMORY_EXTRACTION, EXTRACTION_MODE, HTML_PARSER_ENGINE, SCRAPE_CONCURRENCY, PARSE_WORKERS,
+                        INCREMENTAL_STOP_FRACTION, HEADLESS, RECORD_SNAPSHOTS, CORPUS_DIR,
+                        REPLAY_WORKERS, PAGE_FETCH_TABS, PAGE_FETCH_DELAY, CHECKPOINT_DIR,
+                        BROWSER_CDP_URL, DAEMON_SESSION_CHECK)
+from src import linkedinAutomationAsync as async_automation
+from src.utils.stepTimer import step_timer
+from src.utils.adaptivePacer import pacer, ChallengeError
 import pandas as pd
+import asyncio
 import os
 import time
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
 from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 
 
 def cleanup_files(html_path, pdf_path):
@@ -60,108 +80,583 @@ def export_page_content(page, role_name, page_num):
         return None, None
 
 
-def process_recruiters(html_path, pdf_path):
-    """Process both HTML and PDF files to extract recruiter information"""
-    html_processor = HTMLProcessor()
-    pdf_processor = PDFProcessor()
+def capture_snapshot(page, role_name, page_num, extraction_mode='html', search_responses=None,
+                     keep_html=False):
+    """Capture everything needed to parse the current page, so the browser can move on
 
-    html_results = html_processor.process_file(html_path)
-    pdf_results = pdf_processor.process_file(pdf_path)
+    extraction_mode 'json' decodes recruiters from the search API responses
+    collected by listen_for_search_results, and 'dom' extracts them inside the
+    browser with DOM_EXTRACTION_SCRIPT. Either way the page HTML is only
+    serialized if that yields nothing or keep_html is set. The PDF is rendered
+    up front when titles are missing (or no results were found), since it
+    can't be rendered later.
+    """
+    try:
+        print(f"Capturing page {page_num} snapshot for {role_name}...")
+        snapshot = {'role': role_name, 'page_num': page_num, 'html': None, 'pdf': None, 'records': None}
+
+        if extraction_mode == 'json' and search_responses is not None:
+            # Decode everything received since the last capture: a page can arrive
+            # over several responses, and people repeated across them are deduped
+            payloads = []
+            for response in list(search_responses):
+                try:
+                    payloads.append(response.json())
+                except Exception as e:
+                    print(f"Could not read search response {response.url}: {e}")
+            search_responses.clear()
+            snapshot['records'] = VoyagerProcessor().process_payloads(payloads)
+
+        elif extraction_mode == 'dom':
+            records = page.evaluate(DOM_EXTRACTION_SCRIPT)
+            snapshot['records'] = HTMLProcessor(engine=HTML_PARSER_ENGINE).process_records(records)
+
+        if snapshot['records']:
+            needs_pdf = any(not r['title'] for r in snapshot['records'])
+        else:
+            if extraction_mode != 'html':
+                print(f"No recruiters from {extraction_mode} extraction, falling back to page HTML")
+            snapshot['records'] = None
+            needs_pdf = page.evaluate("""() => {
+                const items = Array.from(document.querySelectorAll('div.entity-result__item'));
+                return items.length === 0 || items.some(item =>
+                    item.querySelector('div.presence-entity') &&
+                    !item.querySelector('div.entity-result__primary-subtitle'));
+            }""")
+
+        if snapshot['records'] is None or keep_html:
+            snapshot['html'] = page.content()
+
+        if needs_pdf:
+            print(f"Rendering PDF for page {page_num} of {role_name}...")
+            try:
+                snapshot['pdf'] = page.pdf()
+            except Exception as e:
+                # page.pdf() only works headless; keep what was extracted, without titles
+                print(f"Could not render PDF, missing titles stay blank: {e}")
+
+        return snapshot
 
-    # Combine and deduplicate results
-    all_recruiters = {}
+    except Exception as e:
+        print(f"Error capturing page snapshot: {e}")
+        return None
 
-    # Process HTML results first
-    for recruiter in html_results:
+
+def parse_snapshot(snapshot):
+    """Extract recruiters from a captured snapshot; safe to run off the browser thread"""
+    with step_timer.step('parse'):
+        pdf_bytes = snapshot.get('pdf')
+        if snapshot.get('records'):
+            # Already extracted on the browser side, only titles may need the PDF
+            all_recruiters = merge_recruiters({}, snapshot['records'])
+            missing_titles = [name for name, r in all_recruiters.items() if not r['title']]
+            if missing_titles and pdf_bytes:
+                titles = PDFProcessor().find_titles(pdf_bytes, missing_titles)
+                for name, title in titles.items():
+                    all_recruiters[name]['title'] = title
+            page_recruiters = list(all_recruiters.values())
+        else:
+            page_recruiters = process_recruiters(
+                html_content=snapshot['html'],
+                render_pdf=(lambda: pdf_bytes) if pdf_bytes else None
+            )
+    print(f"Found {len(page_recruiters)} recruiters on page {snapshot['page_num']} ({snapshot['role']})")
+    return page_recruiters
+
+
+def merge_recruiters(all_recruiters, recruiters):
+    """Merge recruiters into a name-keyed dedup map, filling titles the first sighting lacked"""
+    for recruiter in recruiters:
         name = recruiter['name']
-        if name != "LinkedIn Member":
+        if name == "LinkedIn Member":
+            continue
+        if name in all_recruiters:
+            if not all_recruiters[name]['title'] and recruiter.get('title'):
+                all_recruiters[name]['title'] = recruiter['title']
+        else:
             all_recruiters[name] = recruiter
+    return all_recruiters
 
-    # Add/update with PDF results
-    for recruiter in pdf_results:
-        name = recruiter['name']
-        if name != "LinkedIn Member":
-            if name in all_recruiters:
-                # If PDF has title and HTML doesn't, use PDF's title
-                if not all_recruiters[name]['title'] and recruiter['title']:
-                    all_recruiters[name]['title'] = recruiter['title']
-            else:
-                all_recruiters[name] = recruiter
 
-    return list(all_recruiters.values())
+def process_recruiters(html_path=None, pdf_path=None, html_content=None, render_pdf=None):
+    """Process HTML and PDF page content to extract recruiter information
 
+    Either pass exported file paths, or pass the page HTML as html_content together
+    with a render_pdf callable. The PDF is only read (and, in memory, only rendered)
+    when the HTML pass leaves titles missing, and then only for those recruiters.
+    """
+    html_processor = HTMLProcessor(engine=HTML_PARSER_ENGINE)
+    pdf_processor = PDFProcessor()
 
-def scrape_recruiters(company):
-    """Scrape recruiter names for a given company"""
-    print(f"Starting scraping for {company}...")
+    if html_content is not None:
+        html_results = html_processor.process_html(html_content)
+    else:
+        html_results = html_processor.process_file(html_path)
+
+    # Combine and deduplicate results, HTML results first
+    all_recruiters = merge_recruiters({}, html_results)
+
+    missing_titles = [name for name, recruiter in all_recruiters.items() if not recruiter['title']]
+    has_pdf = bool(pdf_path) or render_pdf is not None
+
+    if not has_pdf:
+        return list(all_recruiters.values())
+
+    # A PDF that can't be rendered (headed Chromium) or read only costs the titles
+    try:
+        if not html_results:
+            # Nothing usable in the HTML, fall back to the full PDF pass
+            print("No recruiters found in HTML, falling back to PDF")
+            pdf_results = (pdf_processor.process_file(pdf_path) if pdf_path
+                           else pdf_processor.process_bytes(render_pdf()))
+            merge_recruiters(all_recruiters, pdf_results)
+
+        elif missing_titles:
+            # If PDF has title and HTML doesn't, use PDF's title
+            print(f"Looking up {len(missing_titles)} missing titles in PDF")
+            titles = pdf_processor.find_titles(pdf_path or render_pdf(), missing_titles)
+            for name, title in titles.items():
+                all_recruiters[name]['title'] = title
+    except Exception as e:
+        print(f"Could not use the page PDF, keeping HTML results: {e}")
 
-    roles = [
+    return list(all_recruiters.values())
+
+
+def get_search_roles(company):
+    """Roles searched for each company"""
+    return [
         {"role": "technical recruiter", "search_text": f"{company} AND technical recruiter"},
         {"role": "university recruiter", "search_text": f"{company} AND university recruiter"}
     ]
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
+
+def scrape_recruiters(company, in_memory=IN_MEMORY_EXTRACTION, parse_workers=PARSE_WORKERS,
+                      incremental=False, record_snapshots=RECORD_SNAPSHOTS,
+                      extraction_mode=EXTRACTION_MODE, page_fetch_tabs=PAGE_FETCH_TABS):
+    """Scrape recruiter names for a given company
+
+    In memory mode the browser only captures snapshots and moves to the next
+    page, while a pool of parse_workers threads parses snapshots as they arrive.
+    In incremental mode new recruiters are merged into the stored file and paging
+    stops once most of a page is already known. With record_snapshots every page
+    is also kept in the page corpus for the replay command. extraction_mode 'json'
+    reads results from the search API responses and 'dom' extracts them in the
+    browser, instead of serializing and parsing the rendered page. With more
+    than one page_fetch_tabs, pages after the first are loaded by URL in
+    parallel waves instead of clicking "next". Progress is checkpointed after
+    every page, so a rerun after a crash resumes where the last one stopped.
+    With BROWSER_CDP_URL set, the scrape runs in new tabs of the browser_daemon
+    browser instead of launching and logging in to its own. Returns True once
+    the recruiters found were saved.
+    """
+    print(f"Starting scraping for {company}...")
+
+    roles = get_search_roles(company)
+    step_timer.reset()
+    corpus = PageCorpus(CORPUS_DIR) if record_snapshots else None
+
+    known_names = load_known_recruiters(company) if incremental else None
+    if incremental:
+        print(f"Incremental scrape: {len(known_names)} recruiters already stored for {company}")
+
+    with sync_playwright() as p, ThreadPoolExecutor(max_workers=max(1, parse_workers)) as parser_pool:
+        browser, context = connect_to_daemon(p, BROWSER_CDP_URL) if BROWSER_CDP_URL else (None, None)
+        attached = context is not None
+        if not attached:
+            browser = p.chromium.launch(headless=HEADLESS)
+            context = new_session_context(browser)
         page = context.new_page()
+        search_responses = (listen_for_search_results(page)
+                            if in_memory and extraction_mode == 'json' else None)
 
         # Create temp directory for intermediate files
-        os.makedirs("./data/temp", exist_ok=True)
+        if not in_memory:
+            os.makedirs("./data/temp", exist_ok=True)
 
-        # Login
-        page.goto('https://linkedin.com/login')
-        time.sleep(2)
-        login(page)
+        # Login, reusing the saved session when it is still valid. The daemon keeps its own session alive
+        if not attached:
+            ensure_logged_in(page)
+            apply_scraping_profile(context)
+        else:
+            apply_scraping_profile(page)
+
+        all_recruiters = {}  # Dedup map of recruiters across pages
+        pending = []  # (role, page, future) for snapshots queued for parsing, in page order
+
+        checkpoint = ScrapeCheckpoint(company, CHECKPOINT_DIR)
+        if checkpoint.load():
+            merge_recruiters(all_recruiters, checkpoint.recruiters)
+            print(f"Resuming from checkpoint with {len(all_recruiters)} recruiters")
+        fetch_tabs = []  # Extra tabs for parallel page fetching, opened on first use
+
+        def handle_page(tab, role_name, page_num, responses):
+            """Capture (and in file mode, parse) one results page; False if capture failed"""
+            print(f"\nProcessing page {page_num}... (pacer: {pacer.describe()})")
+
+            if in_memory:
+                # Hand the snapshot to the parser pool and keep the browser moving
+                with step_timer.step('capture'):
+                    snapshot = capture_snapshot(tab, role_name, page_num, extraction_mode,
+                                                responses, keep_html=corpus is not None)
+                if snapshot is None:
+                    return False
+
+                if corpus:
+                    corpus.record(snapshot['html'], company, role_name, page_num, snapshot['pdf'])
+
+                pending.append((role_name, page_num, parser_pool.submit(parse_snapshot, snapshot)))
+                merge_parsed()
+                return True
+
+            # Export page content
+            with step_timer.step('capture'):
+                html_path, pdf_path = export_page_content(tab, role_name, page_num)
+            if not html_path or not pdf_path:
+                return False
+
+            if corpus:
+                with open(html_path, encoding='utf-8') as f_html, open(pdf_path, 'rb') as f_pdf:
+                    corpus.record(f_html.read(), company, role_name, page_num, f_pdf.read())
+
+            # Process files
+            with step_timer.step('parse'):
+                page_recruiters = process_recruiters(html_path, pdf_path)
 
-        all_recruiters = []  # Store all recruiters across pages
+            # Clean up temp files
+            cleanup_files(html_path, pdf_path)
+
+            print(f"Found {len(page_recruiters)} recruiters on page {page_num}")
+            merge_recruiters(all_recruiters, page_recruiters)
+            checkpoint.page_done(role_name, page_num, all_recruiters)
+            return True
+
+        def merge_parsed(wait=False):
+            """Merge parsed snapshots in page order so results match a serial run, checkpointing each page"""
+            while pending and (wait or pending[0][2].done()):
+                role_name, page_num, future = pending.pop(0)
+                try:
+                    merge_recruiters(all_recruiters, future.result())
+                except Exception as e:
+                    # Not checkpointed, so a rerun fetches the page again
+                    print(f"Error parsing page snapshot: {e}")
+                    continue
+                checkpoint.page_done(role_name, page_num, all_recruiters)
+
+        def mostly_known(tab):
+            return bool(known_names) and known_fraction(tab, known_names) >= INCREMENTAL_STOP_FRACTION
 
-        for role in roles:
-            search_text = role["search_text"]
-            role_name = role["role"]
+        try:
+            for role in roles:
+                search_text = role["search_text"]
+                role_name = role["role"]
+
+                start_page = checkpoint.next_page(role_name)
+                if start_page is None:
+                    print(f"Skipping {role_name}, already finished in the checkpoint")
+                    continue
+
+                open_people_search(page, company, search_text)
+                if start_page > 1:
+                    print(f"Resuming {role_name} at page {start_page}")
+                    start_results_page(page, results_page_url(page.url, start_page))
+                    wait_for_results(page)
+                if not handle_page(page, role_name, start_page, search_responses):
+                    continue
+
+                # The role is only finished once paging ended on the last page or on known recruiters
+                last_page = start_page
+                finished = False
+
+                total_pages = read_page_count(page) if page_fetch_tabs > 1 else None
+                if total_pages:
+                    finished = True
+                    if total_pages > start_page and not mostly_known(page):
+                        # Fan the remaining pages out over the tab pool, a wave at a time
+                        while len(fetch_tabs) < min(page_fetch_tabs, total_pages - start_page):
+                            tab = context.new_page()
+                            if attached:
+                                apply_scraping_profile(tab)
+                            fetch_tabs.append((tab, listen_for_search_results(tab) if search_responses is not None else None))
+
+                        base_url = page.url
+                        print(f"Fetching {total_pages - start_page} more pages with {len(fetch_tabs)} tabs...")
+                        for wave_start in range(start_page + 1, total_pages + 1, len(fetch_tabs)):
+                            wave = list(zip(fetch_tabs, range(wave_start, total_pages + 1)))
+                            stop = False
+
+                            with step_timer.step('fetch_wave'):
+                                started = []
+                                for (tab, responses), page_num in wave:
+                                    if responses is not None:
+                                        responses.clear()
+                                    try:
+                                        start_results_page(tab, results_page_url(base_url, page_num))
+                                    except ChallengeError:
+                                        raise
+                                    except Exception as e:
+                                        # Not checkpointed, so a rerun resumes from this page
+                                        print(f"Error opening page {page_num}: {e}")
+                                        finished = False
+                                        stop = True
+                                        break
+                                    started.append(((tab, responses), page_num))
+                                    pacer.pause(minimum=PAGE_FETCH_DELAY)  # Politeness delay between page loads
+
+                                for (tab, responses), page_num in started:
+                                    try:
+                                        wait_for_results(tab)
+                                    except ChallengeError:
+                                        raise
+                                    except Exception as e:
+                                        print(f"Error loading page {page_num}: {e}")
+                                        finished = False
+                                        stop = True
+                                        break
+                                    last_page = page_num
+                                    if not handle_page(tab, role_name, page_num, responses):
+                                        finished = False
+                                        stop = True
+                                    elif mostly_known(tab):
+                                        stop = True
+
+                            if stop:
+                                print("Stopping page fetch early")
+                                break
+                else:
+                    # Click through the remaining pages one at a time
+                    page_num = start_page
+                    while goto_next_page(page, known_names, INCREMENTAL_STOP_FRACTION):
+                        page_num += 1
+                        if not handle_page(page, role_name, page_num, search_responses):
+                            break
+                    else:
+                        # goto_next_page also gives up on navigation errors, which must not end the role
+                        finished = mostly_known(page) or last_page_reached(page, page_num)
+                    last_page = page_num
+                    print("No more pages available" if finished else f"Stopped paging {role_name} at page {page_num}")
+
+                merge_parsed(wait=True)
+                if finished:
+                    checkpoint.role_done(role_name, all_recruiters, last_page)
+
+        finally:
+            # Keep whatever was parsed in the checkpoint, even when the browser failed
+            merge_parsed(wait=True)
+            if attached:
+                # Leave the daemon's browser running, only close this run's tabs
+                for tab, _ in fetch_tabs:
+                    tab.close()
+                page.close()
+            else:
+                browser.close()
+
+    # Save all recruiters, then drop the checkpoint unless a role still has pages to resume
+    saved = bool(all_recruiters) and save_recruiter_data(list(all_recruiters.values()), company, merge=incremental)
+    if not all_recruiters:
+        print(f"No recruiters found for {company}")
+    if not all_recruiters or saved:
+        if checkpoint.finished([role["role"] for role in roles]):
+            checkpoint.clear()
+        else:
+            print(f"Some roles did not finish, run again to resume from {checkpoint.path}")
 
-            search(page, search_text)
-            filter_recruiters(page, company)
-            time.sleep(5)
+    step_timer.print_report()
+    pacer.log("end of run")
 
-            page_num = 1
+    # Clean up temp directory
+    if not in_memory:
+        try:
+            os.rmdir("./data/temp")
+            print("Removed temp directory")
+        except:
+            print("Note: Temp directory not empty or already removed")
+
+    return saved
+
+
+def _replay_entry(corpus_dir, entry):
+    """Parse one archived snapshot; runs in a replay worker process"""
+    return parse_snapshot(PageCorpus(corpus_dir).load(entry))
+
+
+def replay_corpus(company_arg, workers=REPLAY_WORKERS):
+    """Re-run extraction over archived snapshots without a browser
+
+    company_arg is a company name, or 'all' for the whole corpus. Results are
+    written to <corpus>/replay_results.json and the stored recruiter files are
+    left untouched.
+    """
+    corpus = PageCorpus(CORPUS_DIR)
+    entries = list(corpus.entries(None if company_arg.lower() == 'all' else company_arg))
+    if not entries:
+        print(f"No archived pages found in {CORPUS_DIR} for '{company_arg}'")
+        print("Set RECORD_SNAPSHOTS=true while scraping to build the corpus")
+        return False
+
+    print(f"Replaying {len(entries)} archived pages with {workers} workers...")
+    start = time.perf_counter()
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        chunksize = max(1, len(entries) // (max(1, workers) * 4))
+        page_results = pool.map(_replay_entry, repeat(CORPUS_DIR), entries, chunksize=chunksize)
+        for entry, page_recruiters in zip(entries, page_results):
+            merge_recruiters(results.setdefault(entry['company'], {}), page_recruiters)
+
+    output_path = os.path.join(CORPUS_DIR, "replay_results.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({company: list(recruiters.values()) for company, recruiters in results.items()},
+                  f, indent=2, ensure_ascii=False)
+
+    print(f"\nReplayed {len(entries)} pages in {time.perf_counter() - start:.2f}s")
+    for company, recruiters in sorted(results.items()):
+        print(f"- {company}: {len(recruiters)} recruiters")
+    print(f"Results saved to {output_path}")
+    return True
+
+
+def run_browser_daemon(port_arg):
+    """Keep one logged-in Chromium running for scrape runs to attach to over CDP"""
+    try:
+        port = int(port_arg)
+    except ValueError:
+        print(f"Invalid port '{port_arg}'")
+        return False
+
+    with sync_playwright() as p:
+        context = launch_daemon_context(p, port)
+        page = context.pages[0] if context.pages else context.new_page()
+        ensure_logged_in(page, check_session=True)
+
+        print(f"\nBrowser daemon ready. Attach scrapes with BROWSER_CDP_URL=http://localhost:{port}")
+        print("Press Ctrl+C to stop")
+        try:
             while True:
-                print(f"\nProcessing page {page_num}...")
+                time.sleep(DAEMON_SESSION_CHECK)
+                ensure_logged_in(page, check_session=True)
+        except KeyboardInterrupt:
+            print("\nStopping browser daemon")
+        finally:
+            context.close()
 
-                # Export page content
-                html_path, pdf_path = export_page_content(page, role_name, page_num)
-                if not html_path or not pdf_path:
-                    break
+    return True
 
-                # Process files
-                page_recruiters = process_recruiters(html_path, pdf_path)
-                print(f"Found {len(page_recruiters)} recruiters on page {page_num}")
 
-                # Add to overall list
-                all_recruiters.extend(page_recruiters)
+def rescrape_recruiters(company):
+    """Incrementally re-scrape a company, keeping everything already stored"""
+    return scrape_recruiters(company, incremental=True)
 
-                # Clean up temp files
-                cleanup_files(html_path, pdf_path)
 
-                # Try to go to next page
-                if not goto_next_page(page):
-                    print("No more pages available")
+async def _scrape_company_tab(context, company, tab_id, progress, corpus=None):
+    """Scrape one company in its own tab of the shared, logged-in context"""
+    loop = asyncio.get_running_loop()
+    page = await context.new_page()
+    all_recruiters = {}
+
+    def report(status):
+        progress[company] = status
+        done = sum(1 for s in progress.values() if s.startswith(('done', 'failed')))
+        print(f"[tab {tab_id}] {company}: {status} ({done}/{len(progress)} companies finished)")
+
+    try:
+        for role in get_search_roles(company):
+            role_name = role["role"]
+            report(f"searching {role_name}")
+
+            await async_automation.open_people_search(page, company, role["search_text"])
+
+            page_num = 1
+            while True:
+                html_content = await page.content()
+                if corpus:
+                    corpus.record(html_content, company, role_name, page_num)
+
+                # Parsing runs in a worker thread; a PDF render, if needed, hops back to the loop
+                def render_pdf():
+                    return asyncio.run_coroutine_threadsafe(page.pdf(), loop).result()
+
+                page_recruiters = await asyncio.to_thread(
+                    process_recruiters, html_content=html_content, render_pdf=render_pdf
+                )
+                merge_recruiters(all_recruiters, page_recruiters)
+                report(f"{role_name} page {page_num}, {len(all_recruiters)} recruiters so far")
+
+                if not await async_automation.goto_next_page(page):
                     break
 
                 page_num += 1
-                time.sleep(3)  # Wait between pages
 
-        # Save all recruiters to company file
         if all_recruiters:
-            save_recruiter_data(all_recruiters, company)
+            await asyncio.to_thread(save_recruiter_data, list(all_recruiters.values()), company)
 
-        browser.close()
+        report(f"done, {len(all_recruiters)} recruiters")
+        return True
 
-        # Clean up temp directory
-        try:
-            os.rmdir("./data/temp")
-            print("Removed temp directory")
-        except:
-            print("Note: Temp directory not empty or already removed")
+    except Exception as e:
+        report(f"failed: {e}")
+        return False
+
+    finally:
+        await page.close()
+
+
+async def _scrape_companies(companies, concurrency):
+    """Log in once, then scrape companies in parallel tabs with at most `concurrency` open"""
+    progress = {company: "queued" for company in companies}
+    step_timer.reset()
+    corpus = PageCorpus(CORPUS_DIR) if RECORD_SNAPSHOTS else None
+
+    # Tab slots double as the concurrency cap and the tab ids shown in progress lines
+    tab_slots = asyncio.Queue()
+    for tab_id in range(1, concurrency + 1):
+        tab_slots.put_nowait(tab_id)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=HEADLESS)
+        context = await async_automation.new_session_context(browser)
+
+        # Every tab opened from this context shares the session cookies
+        login_page = await context.new_page()
+        await async_automation.ensure_logged_in(login_page)
+        await login_page.close()
+        await async_automation.apply_scraping_profile(context)
+
+        async def run(company):
+            tab_id = await tab_slots.get()
+            try:
+                return await _scrape_company_tab(context, company, tab_id, progress, corpus)
+            finally:
+                tab_slots.put_nowait(tab_id)
+
+        results = await asyncio.gather(*(run(company) for company in companies))
+        await browser.close()
+
+    print("\nScrape summary:")
+    for company, status in progress.items():
+        print(f"- {company}: {status}")
+    step_timer.print_report()
+
+    return all(results)
+
+
+def scrape_all(companies_arg, concurrency=SCRAPE_CONCURRENCY):
+    """Scrape several companies concurrently over one authenticated browser
+
+    companies_arg is a comma separated list of companies, or 'all' for every
+    company in companies.txt.
+    """
+    if companies_arg.lower() == 'all':
+        company_data = load_company_data()
+        if not company_data:
+            print("No companies found in companies.txt")
+            return False
+        companies = list(company_data.keys())
+    else:
+        companies = [c.strip() for c in companies_arg.split(',') if c.strip()]
+
+    print(f"Scraping {len(companies)} companies with up to {concurrency} tabs...")
+    return asyncio.run(_scrape_companies(companies, max(1, concurrency)))
 
 
 def generate_mails(company):
@@ -173,24 +668,21 @@ def generate_mails(company):
         print("Failed to generate email addresses")
         return False
 
-    # Read the data to show summary
+    # Count the summary in the store instead of reading the table back
     try:
-        df = pd.read_excel(f"data/{company}/recruiters.xlsx")
-        apollo_count = len(df[df['Email Source'] == 'apollo'])
-        fallback_count = len(df[df['Email Source'] == 'fallback'])
-        verified_count = len(df[df['Email Status'] == 'verified'])
+        counts = recruiter_store.summary(company)
 
         print("\nEmail Generation Summary:")
-        print(f"Total recruiters: {len(df)}")
-        print(f"Apollo emails: {apollo_count}")
-        print(f"Fallback emails: {fallback_count}")
-        print(f"Verified emails: {verified_count}")
+        print(f"Total recruiters: {counts['total']}")
+        print(f"Apollo emails: {counts['apollo']}")
+        print(f"Fallback emails: {counts['fallback']}")
+        print(f"Verified emails: {counts['verified']}")
 
     except Exception as e:
         print(f"Error reading summary data: {e}")
 
     print(f"\nEmail generation complete for {company}")
-    print(f"Email data saved in: data/{company}/recruiters.xlsx")
+    print(f"Email data saved in: {recruiter_store.path} (run 'export {company}' for a workbook)")
     return True
 
 
@@ -199,7 +691,7 @@ def generate_drafts(company):
     print(f"\nStarting draft generation for {company}...")
 
     # Check if we have the email data
-    if not os.path.exists(f"data/{company}/recruiters.xlsx"):
+    if not recruiter_store.exists(company):
         print(f"Error: No email data found for {company}")
         print("Please run 'generate_mails' command first")
         return False
@@ -217,23 +709,33 @@ def generate_drafts(company):
 
 
 def send_mails(company):
-    """Send emails to recruiters with Gmail limits"""
+    """Send emails to recruiters with Gmail limits
+
+    Each send is appended to the company's send journal; the recruiter store
+    is updated from the journal once, when the run ends or is interrupted.
+    """
     try:
         # Initialize email sender
         sender = GmailSender()
 
-        # Determine file path based on company name
+        # The test company imports its own workbook on first use
         if company.lower() == 'test':
-            file_path = "data/test/recruiter.xlsx"
+            legacy_path = "data/test/recruiter.xlsx"
         else:
-            file_path = f"data/{company}/recruiters.xlsx"
+            legacy_path = recruiter_store.legacy_path(company)
 
-        if not os.path.exists(file_path):
-            print(f"No recruiter data found at: {file_path}")
+        df = recruiter_store.load(company, legacy_path=legacy_path)
+        if df.empty:
+            print(f"No recruiter data found for {company}")
             return False
 
-        # Read recruiter data
-        df = pd.read_excel(file_path)
+        # Catch up on sends a killed run never wrote back
+        journal = SendJournal(os.path.join(os.path.dirname(legacy_path), "send_journal.jsonl"))
+        recovered = recruiter_store.mark_sent(company, journal.sent())
+        if recovered:
+            print(f"Recovered {recovered} sends from {journal.path}")
+            df = recruiter_store.load(company)
+        pending_sends = 0
 
         # Filter to only send to verified emails from Apollo
         verified_mask = (df['Email Status'] == 'verified') & (df['Email Source'] == 'apollo')
@@ -242,11 +744,6 @@ def send_mails(company):
         print(f"\nFound {len(verified_df)} verified emails from Apollo")
         print(f"Skipping {len(df) - len(verified_df)} unverified or fallback emails")
 
-        # Add Email_Sent column if it doesn't exist
-        if 'Email_Sent' not in verified_df.columns:
-            verified_df['Email_Sent'] = False
-            verified_df['Email_Sent_Date'] = None
-
         # Get count of unsent emails
         unsent_emails = len(verified_df[~verified_df['Email_Sent']])
         print(f"\nPreparing to send emails for {company}")
@@ -265,56 +762,60 @@ def send_mails(company):
         minute_start = time.time()
 
         # Send emails to each verified recruiter
-        for idx, row in verified_df.iterrows():
-            if pd.isna(row['Email_Sent']) or not row['Email_Sent']:
-                # Check daily limit
-                if emails_sent_today >= DAILY_LIMIT:
-                    remaining = len(verified_df[~verified_df['Email_Sent']]) - emails_sent_today
-                    print(f"\nReached daily limit of {DAILY_LIMIT} emails")
-                    print(f"Still have {remaining} verified emails remaining")
-                    print("Run the script again tomorrow to continue sending")
-                    break
-
-                # Rate limiting logic remains the same
-                current_time = time.time()
-                if current_time - minute_start >= 60:
-                    minute_start = current_time
-                    emails_sent_minute = 0
-                elif emails_sent_minute >= 20:
-                    wait_time = 60 - (current_time - minute_start)
-                    print(f"\nReached rate limit. Waiting {wait_time:.0f} seconds...")
-                    time.sleep(wait_time)
-                    minute_start = time.time()
-                    emails_sent_minute = 0
-
-                print(f"\nSending email to: {row['Full Name']} ({row['Email']})")
-                print(f"Email Status: {row['Email Status']}")
-                print(f"Emails sent today: {emails_sent_today}/{DAILY_LIMIT}")
-
-                if sender.send_email(
-                        to_email=row['Email'],
-                        recruiter_name=row['First Name'],
-                        company_name=company
-                ):
-                    # Update both DataFrames
-                    verified_df.at[idx, 'Email_Sent'] = True
-                    verified_df.at[idx, 'Email_Sent_Date'] = pd.Timestamp.now()
-                    df.at[idx, 'Email_Sent'] = True
-                    df.at[idx, 'Email_Sent_Date'] = pd.Timestamp.now()
-
-                    # Save after each successful send
-                    df.to_excel(file_path, index=False)
-                    print("Email sent successfully!")
-
-                    emails_sent_today += 1
-                    emails_sent_minute += 1
-
-                    if idx < len(verified_df) - 1:
-                        delay = 5
-                        print(f"Waiting {delay} seconds before next email...")
-                        time.sleep(delay)
-                else:
-                    print("Failed to send email")
+        try:
+            for idx, row in verified_df.iterrows():
+                if pd.isna(row['Email_Sent']) or not row['Email_Sent']:
+                    # Check daily limit
+                    if emails_sent_today >= DAILY_LIMIT:
+                        remaining = len(verified_df[~verified_df['Email_Sent']]) - emails_sent_today
+                        print(f"\nReached daily limit of {DAILY_LIMIT} emails")
+                        print(f"Still have {remaining} verified emails remaining")
+                        print("Run the script again tomorrow to continue sending")
+                        break
+
+                    # Rate limiting logic remains the same
+                    current_time = time.time()
+                    if current_time - minute_start >= 60:
+                        minute_start = current_time
+                        emails_sent_minute = 0
+                    elif emails_sent_minute >= 20:
+                        wait_time = 60 - (current_time - minute_start)
+                        print(f"\nReached rate limit. Waiting {wait_time:.0f} seconds...")
+                        time.sleep(wait_time)
+                        minute_start = time.time()
+                        emails_sent_minute = 0
+
+                    print(f"\nSending email to: {row['Full Name']} ({row['Email']})")
+                    print(f"Email Status: {row['Email Status']}")
+                    print(f"Emails sent today: {emails_sent_today}/{DAILY_LIMIT}")
+
+                    if sender.send_email(
+                            to_email=row['Email'],
+                            recruiter_name=row['First Name'],
+                            company_name=company
+                    ):
+                        # Journal the send; the store is updated once at the end
+                        journal.record(row['Full Name'], row['Email'])
+                        verified_df.at[idx, 'Email_Sent'] = True
+                        verified_df.at[idx, 'Email_Sent_Date'] = pd.Timestamp.now()
+                        pending_sends += 1
+                        print("Email sent successfully!")
+
+                        emails_sent_today += 1
+                        emails_sent_minute += 1
+
+                        if idx < len(verified_df) - 1:
+                            delay = 5
+                            print(f"Waiting {delay} seconds before next email...")
+                            time.sleep(delay)
+                    else:
+                        print("Failed to send email")
+
+        finally:
+            # Reconcile the store with the journal, also on Ctrl+C or errors
+            if pending_sends:
+                recorded = recruiter_store.mark_sent(company, journal.sent())
+                print(f"Recorded {recorded} sends in {recruiter_store.path}")
 
         # Print summary
         sent_count = verified_df['Email_Sent'].sum()
@@ -331,20 +832,50 @@ def send_mails(company):
         return False
 
 
+def export_recruiters(company_arg):
+    """Write stored recruiters to data/<company>/recruiters.xlsx
+
+    company_arg is a company name, or 'all' for every company in the store.
+    """
+    companies = recruiter_store.companies() if company_arg.lower() == 'all' else [company_arg]
+    companies = [company for company in companies if recruiter_store.exists(company)]
+    if not companies:
+        print(f"No recruiters stored in {recruiter_store.path} for '{company_arg}'")
+        return False
+
+    try:
+        for company in companies:
+            path = recruiter_store.export(company)
+            print(f"Exported {company} to {path}")
+        return True
+    except Exception as e:
+        print(f"Error exporting recruiters: {e}")
+        return False
+
+
 def print_usage():
     print("""
     LinkedIn Recruiter Email Automation Tool
 
     Usage:
         python3 autobot.py scrape <company_name>         - Scrape recruiter information from LinkedIn
+        python3 autobot.py rescrape <company_name>       - Add newly listed recruiters to an existing scrape
+        python3 autobot.py scrape_all <companies|all>    - Scrape several companies in parallel tabs
+        python3 autobot.py replay <company_name|all>     - Re-run extraction over archived pages
+        python3 autobot.py browser_daemon <port>         - Keep a logged-in browser running for scrapes to attach to
         python3 autobot.py generate_mails <company_name> - Generate email addresses using Apollo API
         python3 autobot.py generate_drafts <company_name> - Generate email drafts
         python3 autobot.py send_mails <company_name>     - Send emails to recruiters (verified Apollo emails only)
+        python3 autobot.py export <company_name|all>     - Write stored recruiters to data/<company_name>/recruiters.xlsx
 
     Examples:
         # Scrape recruiters from Google:
         python3 autobot.py scrape Google
 
+        # Scrape every company in companies.txt, or a comma separated list:
+        python3 autobot.py scrape_all all
+        python3 autobot.py scrape_all "Google,Microsoft"
+
         # Generate email drafts for Google recruiters:
         python3 autobot.py generate_mails Google
 
@@ -356,6 +887,7 @@ def print_usage():
         - Only verified emails from Apollo API will be sent
         - Emails are limited to 300 sends per day
         - Check data/<company_name>/drafts/preview.html to review drafts
+        - Recruiters are stored in data/recruiters.db; use 'export' for a workbook
         """)
 
 
@@ -369,9 +901,14 @@ def main():
 
     valid_commands = {
         "scrape": scrape_recruiters,
+        "rescrape": rescrape_recruiters,
+        "scrape_all": scrape_all,
+        "replay": replay_corpus,
+        "browser_daemon": run_browser_daemon,
         "generate_mails": generate_mails,
         "generate_drafts": generate_drafts,
-        "send_mails": send_mails
+        "send_mails": send_mails,
+        "export": export_recruiters
     }
 
     if command not in valid_commands:
@@ -5,3 +5,79 @@ load_dotenv()
 
 LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
 LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
+
+# Saved cookies and local storage of the last authenticated LinkedIn session
+LINKEDIN_STORAGE_STATE = os.getenv("LINKEDIN_STORAGE_STATE", "data/session/linkedin_state.json")
+
+# LinkedIn current-company filter IDs resolved so far, keyed by company name
+COMPANY_ID_CACHE = os.getenv("COMPANY_ID_CACHE", "data/cache/company_ids.json")
+
+# Keep page snapshots in memory instead of round-tripping them through ./data/temp
+IN_MEMORY_EXTRACTION = os.getenv("IN_MEMORY_EXTRACTION", "true").lower() == "true"
+
+# Where in-memory scraping reads results from: html (serialized page), json
+# (the search API responses) or dom (extracted in the browser by page.evaluate).
+# json and dom fall back to html when they yield nothing
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "html").lower()
+
+# HTML parser backend for HTMLProcessor: auto, lxml, strainer or soup
+HTML_PARSER_ENGINE = os.getenv("HTML_PARSER_ENGINE", "auto")
+
+# Number of companies scraped at once by the scrape_all command
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "3"))
+
+# Threads parsing page snapshots while the browser moves on to the next page
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "2"))
+
+# rescrape stops paging once this fraction of a results page is already stored
+INCREMENTAL_STOP_FRACTION = float(os.getenv("INCREMENTAL_STOP_FRACTION", "0.8"))
+
+# Run the scraping browser without a window. page.pdf() only works headless
+HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+
+# Abort image, media, font and third-party requests on search pages
+BLOCK_HEAVY_RESOURCES = os.getenv("BLOCK_HEAVY_RESOURCES", "true").lower() == "true"
+
+# Comma separated URL fragments that are never blocked
+RESOURCE_ALLOWLIST = [fragment.strip() for fragment in os.getenv("RESOURCE_ALLOWLIST", "").split(",")
+                      if fragment.strip()]
+
+# Keep every captured results page in a compressed corpus for offline replay
+RECORD_SNAPSHOTS = os.getenv("RECORD_SNAPSHOTS", "false").lower() == "true"
+CORPUS_DIR = os.getenv("CORPUS_DIR", "data/corpus")
+
+# Processes used by the replay command
+REPLAY_WORKERS = int(os.getenv("REPLAY_WORKERS", str(os.cpu_count() or 2)))
+
+# Extra tabs fetching result pages by URL in parallel waves (1 = click through pages)
+PAGE_FETCH_TABS = int(os.getenv("PAGE_FETCH_TABS", "1"))
+# Seconds between starting page loads within a wave
+PAGE_FETCH_DELAY = float(os.getenv("PAGE_FETCH_DELAY", "1.0"))
+
+# Per-company progress files that let an interrupted scrape resume
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", "data/checkpoints")
+
+# Adaptive pacing between LinkedIn navigations: the delay floats between these bounds (seconds)
+PACER_MIN_DELAY = float(os.getenv("PACER_MIN_DELAY", "0"))
+PACER_MAX_DELAY = float(os.getenv("PACER_MAX_DELAY", "30"))
+# Seconds to wait for a checkpoint/CAPTCHA page to be cleared (e.g. solved in the window) before giving up
+CHALLENGE_COOLDOWN = float(os.getenv("CHALLENGE_COOLDOWN", "120"))
+
+# Long-lived browser started by the browser_daemon command. When BROWSER_CDP_URL is set
+# (e.g. http://localhost:9222) scrape attaches to it instead of launching Chromium
+BROWSER_CDP_URL = os.getenv("BROWSER_CDP_URL", "")
+BROWSER_PROFILE_DIR = os.getenv("BROWSER_PROFILE_DIR", "data/session/browser_profile")
+# Seconds between the daemon's session checks
+DAEMON_SESSION_CHECK = int(os.getenv("DAEMON_SESSION_CHECK", "600"))
+
+# SQLite database holding every company's recruiters (recruiters.xlsx is an export)
+RECRUITER_DB = os.getenv("RECRUITER_DB", "data/recruiters.db")
+
+# Apollo enrichment: requests in flight at once, and the plan's request budgets
+APOLLO_CONCURRENCY = int(os.getenv("APOLLO_CONCURRENCY", "4"))
+APOLLO_MINUTE_LIMIT = int(os.getenv("APOLLO_MINUTE_LIMIT", "50"))
+APOLLO_HOURLY_LIMIT = int(os.getenv("APOLLO_HOURLY_LIMIT", "200"))
+APOLLO_DAILY_LIMIT = int(os.getenv("APOLLO_DAILY_LIMIT", "600"))
+
+# Longest wait in seconds for the next Apollo request slot before enrichment stops for now
+APOLLO_MAX_WAIT = float(os.getenv("APOLLO_MAX_WAIT", "900"))
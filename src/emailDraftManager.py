@@ -4,6 +4,7 @@ import json
 import pandas as pd
 from datetime import datetime
 from src.utils.templateManager import template_manager
+from src.recruiterStore import recruiter_store
 from src.utils.html_templates import get_preview_html_template, get_draft_container_template
 
 
@@ -24,12 +25,11 @@ class EmailDraftManager:
         """Generate email drafts for a company"""
         try:
             # Read recruiter data
-            file_path = f"data/{company}/recruiters.xlsx"
-            if not os.path.exists(file_path):
+            df = recruiter_store.load(company)
+            if df.empty:
                 print(f"No recruiter data found for {company}")
                 return False
 
-            df = pd.read_excel(file_path)
             print(f"Generating drafts for {len(df)} recruiters...")
 
             # Create drafts directory
@@ -44,10 +44,6 @@ class EmailDraftManager:
                 "drafts": []
             }
 
-            # Add Email_Draft column to Excel if it doesn't exist
-            if 'Email_Draft' not in df.columns:
-                df['Email_Draft'] = None
-
             # Ensure Email_Draft column is of object type to store HTML content
             if df['Email_Draft'].dtype != 'object':
                 df['Email_Draft'] = df['Email_Draft'].astype('object')
@@ -71,7 +67,7 @@ class EmailDraftManager:
                 draft_plain = formatted_email["plain"]
                 subject = formatted_email["subject"]
 
-                # Store draft in Excel
+                # Store draft with the recruiter
                 df.at[idx, 'Email_Draft'] = draft_html
 
                 # Add to quick-copy format
@@ -83,9 +79,9 @@ class EmailDraftManager:
                     "draft_plain": draft_plain
                 })
 
-            # Save updated Excel file
-            df.to_excel(file_path, index=False)
-            print(f"Updated {file_path} with draft emails")
+            # Save drafts to the store
+            recruiter_store.upsert(company, df[['Full Name', 'Email_Draft']])
+            print(f"Saved draft emails for {company} to {recruiter_store.path}")
 
             # Save quick-copy format
             drafts_file = f"{drafts_dir}/drafts.json"
@@ -0,0 +1,39 @@
+import pandas as pd
+from src.sendJournal import JsonlJournal
+from src.recruiterStore import recruiter_store
+
+
+class EnrichmentJournal(JsonlJournal):
+    """Delta log of Apollo enrichment results for one company
+
+    get_mails_from_apollo appends each recruiter's new fields as the API
+    response arrives, so a crash loses at most the record in flight. The log
+    is compacted into the recruiter store when enrichment ends, or at the
+    start of the next run if the last one never got that far.
+    """
+
+    def __init__(self, company: str, path: str = None):
+        super().__init__(path or f"data/{company}/enrichment_journal.jsonl")
+        self.company = company
+
+    def record(self, full_name: str, fields: dict):
+        """Durably log the enriched fields of one recruiter"""
+        self.append({'Full Name': full_name, **fields})
+
+    def updates(self) -> pd.DataFrame:
+        """Latest journaled fields per recruiter, with the workbook's column names"""
+        latest = {}
+        for entry in self.entries():
+            latest.setdefault(entry['Full Name'], {}).update(entry)
+        return pd.DataFrame(list(latest.values()))
+
+    def compact(self) -> int:
+        """Write journaled results to the store and empty the log; returns how many rows changed
+
+        Only recruiters still stored are updated, so names dropped since they
+        were journaled (by a merge or rescrape) don't come back as partial rows.
+        """
+        updates = self.updates()
+        changed = recruiter_store.update(self.company, updates) if not updates.empty else 0
+        self.clear()
+        return changed
@@ -1,42 +1,64 @@
 import pandas as pd
-import os
-from .emailGenerator import EmailGenerator
 from .utils.NameCleaner import NameCleaner
-import time
+from .utils.recruiterDedup import dedupe_recruiters, changed_columns
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import re
 from src.utils.apollo_client import ApolloClient
+from src.recruiterStore import recruiter_store
+from src.enrichmentJournal import EnrichmentJournal
+from src.config import APOLLO_CONCURRENCY
 
+# Attempts per recruiter when Apollo answers 429 despite the rate limiter
+APOLLO_RETRIES = 3
 
-def save_recruiter_data(recruiters: list, company: str) -> bool:
-    """Save initial recruiter data to Excel with cleaning"""
 
+def load_known_recruiters(company: str) -> set:
+    """Return the cleaned full names already stored for a company"""
     try:
-        cleaner = NameCleaner()
-        data = []
-        for recruiter in recruiters:
-            cleaned_name = cleaner.clean_name(recruiter['name'])
-            if cleaned_name:
-                data.append({
-                    'Full Name': cleaned_name['full_name'],
-                    'First Name': cleaned_name['first_name'],
-                    'Middle Name': cleaned_name['middle_name'],
-                    'Last Name': cleaned_name['last_name'],
-                    'Title': cleaner.clean_title(recruiter.get('title', '')),
-                    'Role': '',
-                    'Email': '',
-                    'Email Status': '',  # verified, unavailable, or fallback
-                    'Email Source': '',  # apollo or fallback
-                    'LinkedIn URL': recruiter.get('linkedin_url', ''),
-                    'Headline': '',
-                    'Company': company,
-                    'Status': 'New',
-                    'Last Updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-
-        # Create DataFrame and handle duplicates
-        df = pd.DataFrame(data)
-        df = df.drop_duplicates(subset=['Full Name'], keep='first')
+        return recruiter_store.full_names(company)
+    except Exception as e:
+        print(f"Error loading known recruiters: {e}")
+        return set()
+
+
+def save_recruiter_data(recruiters: list, company: str, merge: bool = False) -> bool:
+    """Save initial recruiter data to the recruiter store with cleaning
+
+    With merge=True, recruiters already stored for the company are kept as they
+    are (emails, drafts, send status) and only new recruiters are added.
+    """
+
+    try:
+        # Clean every name and title in one batch
+        names = NameCleaner.clean_names([recruiter['name'] for recruiter in recruiters])
+        titles = NameCleaner.clean_titles([recruiter.get('title', '') for recruiter in recruiters])
+        urls = pd.Series([recruiter.get('linkedin_url', '') for recruiter in recruiters], dtype=object)
+        valid = names['full_name'].notna()
+
+        if not valid.any():
+            print("No valid recruiter names to save")
+            return False
+
+        df = pd.DataFrame({
+            'Full Name': names['full_name'],
+            'First Name': names['first_name'],
+            'Middle Name': names['middle_name'],
+            'Last Name': names['last_name'],
+            'Title': titles,
+            'Role': '',
+            'Email': '',
+            'Email Status': '',  # verified, unavailable, or fallback
+            'Email Source': '',  # apollo or fallback
+            'LinkedIn URL': urls,
+            'Headline': '',
+            'Company': company,
+            'Status': 'New',
+            'Last Updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        })[valid].reset_index(drop=True)
+
+        # Handle duplicates, including spelling variants of the same person
+        df = dedupe_recruiters(df)
 
         # Ensure proper data types
         string_columns = ['Full Name', 'First Name', 'Middle Name', 'Last Name',
@@ -45,12 +67,18 @@ def save_recruiter_data(recruiters: list, company: str) -> bool:
         for col in string_columns:
             df[col] = df[col].astype('string')
 
-        # Save file
-        os.makedirs(f"data/{company}", exist_ok=True)
-        file_path = f"data/{company}/recruiters.xlsx"
-        df.to_excel(file_path, index=False)
+        # Save to the store
+        if merge:
+            existing = recruiter_store.load(company)
+            new_rows = dedupe_recruiters(df, existing=existing)
+            print(f"Adding {len(new_rows)} new recruiters to {len(existing)} already stored")
+            recruiter_store.insert_new(company, new_rows)
+            total = len(existing) + len(new_rows)
+        else:
+            recruiter_store.replace(company, df)
+            total = len(df)
 
-        print(f"\nSaved {len(df)} unique recruiters to {file_path}")
+        print(f"\nSaved {total} unique recruiters for {company} to {recruiter_store.path}")
         return True
 
     except Exception as e:
@@ -58,17 +86,36 @@ def save_recruiter_data(recruiters: list, company: str) -> bool:
         return False
 
 
-def get_mails_from_apollo(company: str) -> bool:
-    """Generate emails for recruiters using Apollo API with rate limiting"""
+def get_mails_from_apollo(company: str, concurrency: int = APOLLO_CONCURRENCY) -> bool:
+    """Generate emails for recruiters using Apollo API with rate limiting
+
+    Up to `concurrency` requests are in flight, paced by the shared Apollo
+    rate limiter, and results are reported in table order. Enrichment stops
+    for now only when the next request slot is more than APOLLO_MAX_WAIT away.
+    Each result is journaled as it arrives and the journal is compacted into
+    the recruiter store when the run stops, or when the next run starts.
+    """
+    journal = EnrichmentJournal(company)
     try:
-        file_path = f"data/{company}/recruiters.xlsx"
-        if not os.path.exists(file_path):
-            print(f"File not found: {file_path}")
+        recovered = journal.compact()
+        if recovered:
+            print(f"Recovered {recovered} enrichment results from {journal.path}")
+
+        df = recruiter_store.load(company)
+        if df.empty:
+            print(f"No recruiters stored for {company}")
             return False
 
-        # Read and clean data
-        df = pd.read_excel(file_path)
-        df = df.drop_duplicates(subset=['Full Name'], keep='first')
+        # Drop near-duplicates before they cost Apollo credits, writing back only merged cells
+        deduped = dedupe_recruiters(df)
+        if len(deduped) < len(df):
+            updates = {}
+            for label, columns in changed_columns(df, deduped).items():
+                updates.setdefault(tuple(columns), []).append(label)
+            for columns, labels in updates.items():
+                recruiter_store.upsert(company, deduped.loc[labels, ['Full Name', *columns]])
+            recruiter_store.delete(company, set(df['Full Name']) - set(deduped['Full Name']))
+        df = deduped
 
         # Ensure proper data types and handle NA values
         string_columns = ['Full Name', 'First Name', 'Last Name', 'Title', 'Email',
@@ -88,7 +135,8 @@ def get_mails_from_apollo(company: str) -> bool:
         print(f"\nStarting email generation for {company}")
         print(f"Total records to check: {total_to_process}")
 
-        for index, row in df.iterrows():
+        pending = []
+        for _, row in df.iterrows():
             # Skip records that already have a valid email
             if row['Email'] != '':
                 stats['skipped'] += 1
@@ -103,58 +151,91 @@ def get_mails_from_apollo(company: str) -> bool:
                 already_processed += 1
                 continue
 
-            # Generate email for this record
-            person_data = apollo_client.fetch_apollo_data(
-                first_name=row['First Name'],
-                last_name=row['Last Name'],
-                organization_name=company,
-                domain=f"@{company.lower().replace(' ', '')}.com"
-            )
+            pending.append(row)
+
+        # Requests run concurrently at the pace of the shared rate limiter
+        stop = threading.Event()
+
+        def fetch(row):
+            if stop.is_set():
+                return None
+            for _ in range(APOLLO_RETRIES):
+                person_data = apollo_client.fetch_apollo_data(
+                    first_name=row['First Name'],
+                    last_name=row['Last Name'],
+                    organization_name=company,
+                    domain=f"@{company.lower().replace(' ', '')}.com",
+                    stop=stop
+                )
+                # A 429 throttles the limiter, so the retry waits for the next slot
+                if person_data.get('error') != 'Rate limit exceeded':
+                    break
 
             if 'error' in person_data:
-                if 'limit reached' in person_data['error'] or 'rate limit' in person_data['error'].lower():
-                    print(f"Rate limit reached: {person_data['error']}")
-                    # Save progress before stopping
-                    df.to_excel(file_path, index=False)
-                    print(f"\nProgress before stopping: {already_processed}/{total_to_process}")
-                    print(f"Apollo API: {stats['apollo']}")
-                    print(f"Fallback Method: {stats['fallback']}")
-                    print(f"Skipped (has email): {stats['skipped']}")
-                    print(f"Skipped (unavailable): {stats['skipped_unavailable']}")
-                    print(f"Errors: {stats['error']}")
-                    return True
-
-                stats['error'] += 1
-                print(f"Generated (error): {row['Full Name']} -> None")
-                already_processed += 1
-                continue
+                if stop.is_set():
+                    return None  # Another request stopped the run while this one waited
+                if 'limit' in person_data['error'].lower():
+                    stop.set()
+                return person_data
 
+            # Journal all available fields as soon as the response arrives
             person = person_data.get('person', {})
+            journal.record(row['Full Name'], {
+                'Email': person.get('email', ''),
+                'Email Status': person.get('email_status', 'fallback'),
+                'Email Source': 'apollo',
+                'LinkedIn URL': person.get('linkedin_url', row['LinkedIn URL']),  # Keep existing if not found
+                'First Name': person.get('first_name', row['First Name']),  # Keep existing if not found
+                'Last Name': person.get('last_name', row['Last Name']),  # Keep existing if not found
+                'Title': person.get('title', row['Title']),
+                'Headline': person.get('headline', ''),
+                'Last Updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            })
+            return person_data
 
-            # Update all available fields
-            df.at[index, 'Email'] = person.get('email', '')
-            df.at[index, 'Email Status'] = person.get('email_status', 'fallback')
-            df.at[index, 'Email Source'] = 'apollo'
-            df.at[index, 'LinkedIn URL'] = person.get('linkedin_url', row['LinkedIn URL'])  # Keep existing if not found
-            df.at[index, 'First Name'] = person.get('first_name', row['First Name'])  # Keep existing if not found
-            df.at[index, 'Last Name'] = person.get('last_name', row['Last Name'])  # Keep existing if not found
-            df.at[index, 'Title'] = person.get('title', row['Title'])
-            df.at[index, 'Headline'] = person.get('headline', '')
-            df.at[index, 'Last Updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        limit_message = None
+        pool = ThreadPoolExecutor(max_workers=max(1, concurrency))
+        try:
+            futures = [pool.submit(fetch, row) for row in pending]
+
+            # Report results in table order; each was journaled when it arrived
+            for row, future in zip(pending, futures):
+                person_data = future.result()
+                if person_data is None:
+                    continue
 
-            status = 'apollo' if person.get('email') else 'error'
-            stats[status] += 1
+                if 'error' in person_data:
+                    if 'limit reached' in person_data['error'] or 'rate limit' in person_data['error'].lower():
+                        limit_message = limit_message or person_data['error']
+                        continue
 
-            print(f"Generated ({status}): {row['Full Name']} -> {person.get('email', 'No email found')}")
-            already_processed += 1
+                    stats['error'] += 1
+                    print(f"Generated (error): {row['Full Name']} -> None")
+                    already_processed += 1
+                    continue
 
-            # Save progress periodically (every 10 records)
-            if already_processed % 10 == 0:
-                df.to_excel(file_path, index=False)
-                print(f"Progress saved at {already_processed}/{total_to_process} records")
+                person = person_data.get('person', {})
+                status = 'apollo' if person.get('email') else 'error'
+                stats[status] += 1
+
+                print(f"Generated ({status}): {row['Full Name']} -> {person.get('email', 'No email found')}")
+                already_processed += 1
+        finally:
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
 
         # Save final results
-        df.to_excel(file_path, index=False)
+        journal.compact()
+
+        if limit_message:
+            print(f"Rate limit reached: {limit_message}")
+            print(f"\nProgress before stopping: {already_processed}/{total_to_process}")
+            print(f"Apollo API: {stats['apollo']}")
+            print(f"Fallback Method: {stats['fallback']}")
+            print(f"Skipped (has email): {stats['skipped']}")
+            print(f"Skipped (unavailable): {stats['skipped_unavailable']}")
+            print(f"Errors: {stats['error']}")
+            return True
 
         print(f"\nEmail Generation Summary:")
         print(f"Apollo API: {stats['apollo']}")
@@ -172,7 +253,7 @@ def get_mails_from_apollo(company: str) -> bool:
 
         # Try to save progress even if there's an error
         try:
-            df.to_excel(file_path, index=False)
+            journal.compact()
             print("Saved progress despite error")
         except:
             pass
@@ -1,64 +1,273 @@
-from typing import List, Dict
-from bs4 import BeautifulSoup
+import re
+from typing import List, Dict, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+except ImportError:  # lxml is optional, the strainer engine is used instead
+    lxml = None
+
+
+# Names that are never recruiters: anonymised profiles and the logged-in user
+SKIPPED_NAMES = {"LinkedIn Member", "Krishna Sarda"}
+
+# Keep only result items and any stray profile containers when straining the parse
+RESULT_STRAINER = SoupStrainer(
+    'div', class_=re.compile(r'(?:^|\s)(?:entity-result__item|presence-entity)(?:\s|$)')
+)
+
+# Tags whose text BeautifulSoup leaves out of get_text()
+NON_TEXT_TAGS = {'script', 'style', 'template'}
+
+
+# HTMLProcessor's selection logic run inside the browser with page.evaluate, so
+# only a small array of records crosses over instead of the serialized page.
+# Titles mirror BeautifulSoup's get_text(strip=True).
+DOM_EXTRACTION_SCRIPT = """() => {
+    const skipped = new Set(['SCRIPT', 'STYLE', 'TEMPLATE']);
+    const strippedText = (element) => {
+        const parts = [];
+        const walk = (node) => {
+            for (const child of node.childNodes) {
+                if (child.nodeType === Node.TEXT_NODE) {
+                    const text = child.nodeValue.trim();
+                    if (text) parts.push(text);
+                } else if (child.nodeType === Node.ELEMENT_NODE && !skipped.has(child.tagName)) {
+                    walk(child);
+                }
+            }
+        };
+        walk(element);
+        return parts.join('');
+    };
+
+    const records = [];
+    for (const container of document.querySelectorAll('div.presence-entity')) {
+        const img = container.querySelector('img');
+        const alt = img && img.getAttribute('alt');
+        if (!alt) continue;
+
+        const item = container.parentElement && container.parentElement.closest('div.entity-result__item');
+        let title = '';
+        let profileUrl = '';
+        if (item) {
+            const subtitle = item.querySelector('div.entity-result__primary-subtitle');
+            title = subtitle ? strippedText(subtitle) : '';
+            const link = item.querySelector('a[href*="/in/"]');
+            profileUrl = link ? link.getAttribute('href').split('?')[0] : '';
+        }
+        records.push({name: alt.trim(), title: title, profile_url: profileUrl});
+    }
+    return records;
+}"""
+
+
+def _has_class(class_attr: Optional[str], class_name: str) -> bool:
+    """Match a class token the same way BeautifulSoup's class_ filter does"""
+    return bool(class_attr) and class_name in class_attr.split()
+
+
+def _profile_url(href: Optional[str]) -> str:
+    """Normalise a profile link by dropping LinkedIn's tracking query string"""
+    if not href:
+        return ""
+    return href.split('?')[0]
 
 
 class HTMLProcessor:
-    def __init__(self):
+    """Extract recruiters from LinkedIn people-search results pages.
+
+    Engines:
+        soup     - full html.parser tree, the original implementation
+        strainer - html.parser limited to result items with a SoupStrainer
+        lxml     - lxml tree, each result item is read once
+        auto     - lxml when installed, otherwise strainer
+    All engines produce the same records.
+    """
+
+    ENGINES = ('soup', 'strainer', 'lxml')
+
+    def __init__(self, engine: str = 'auto'):
         self.selectors = {
             'container': 'div.presence-entity',
             'name': 'img[alt]',
-            'title': '.entity-result__primary-subtitle'
+            'title': '.entity-result__primary-subtitle',
+            'profile_link': 'a[href*="/in/"]'
         }
 
+        if engine == 'auto':
+            engine = 'lxml' if lxml is not None else 'strainer'
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown HTML engine: {engine}")
+        if engine == 'lxml' and lxml is None:
+            raise ValueError("lxml engine requested but lxml is not installed")
+        self.engine = engine
+
     def process_file(self, file_path: str) -> List[Dict[str, str]]:
         """Process a LinkedIn HTML file and extract recruiter information"""
         try:
             print(f"Processing HTML file: {file_path}")
-            recruiters = []
-            seen_names = set()  # To track duplicates
-
-            # Read and parse the HTML file
             with open(file_path, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f, 'html.parser')
-
-            # Find all presence-entity divs (profile containers)
-            containers = soup.find_all('div', class_='presence-entity')
-            print(f"Found {len(containers)} profile containers")
-
-            for container in containers:
-                # Get name from img alt attribute
-                img = container.find('img')
-                if img and img.get('alt'):
-                    name = img.get('alt').strip()
-
-                    # Skip if it's your own name or LinkedIn Member or we've seen it before
-                    if (name != "LinkedIn Member" and
-                            name != "Krishna Sarda" and
-                            name not in seen_names):
-
-                        # Get title by traversing up and finding subtitle
-                        parent_container = container.find_parent('div', class_='entity-result__item')
-                        title = ""
-                        if parent_container:
-                            title_elem = parent_container.find('div', class_='entity-result__primary-subtitle')
-                            if title_elem:
-                                title = title_elem.get_text(strip=True)
-
-                        recruiter = {
-                            'name': name,
-                            'title': title
-                        }
-                        recruiters.append(recruiter)
-                        seen_names.add(name)
-                        print(f"Found person: {name} - {title}")
-
-            print(f"Successfully extracted {len(recruiters)} unique recruiters")
-            return recruiters
+                return self.process_html(f.read())
 
         except Exception as e:
             print(f"Error processing HTML file: {e}")
             return []
 
+    def process_html(self, html: str) -> List[Dict[str, str]]:
+        """Extract recruiter information from LinkedIn page HTML held in memory"""
+        try:
+            if self.engine == 'lxml':
+                people = self._extract_lxml(html)
+            else:
+                people = self._extract_soup(html, strained=self.engine == 'strainer')
+
+            return self._unique_recruiters(people)
+
+        except Exception as e:
+            print(f"Error processing HTML content: {e}")
+            return []
+
+    def process_records(self, records: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Apply the same filtering to records returned by DOM_EXTRACTION_SCRIPT"""
+        try:
+            print(f"Found {len(records)} profile containers")
+            return self._unique_recruiters(
+                (r['name'], r['title'], r['profile_url']) for r in records
+            )
+
+        except Exception as e:
+            print(f"Error processing extracted records: {e}")
+            return []
+
+    def _unique_recruiters(self, people) -> List[Dict[str, str]]:
+        """Build recruiter records from (name, title, profile url), skipping repeats"""
+        recruiters = []
+        seen_names = set()  # To track duplicates
+
+        for name, title, linkedin_url in people:
+            # Skip if it's your own name or LinkedIn Member or we've seen it before
+            if name in SKIPPED_NAMES or name in seen_names:
+                continue
+
+            recruiters.append({
+                'name': name,
+                'title': title,
+                'linkedin_url': linkedin_url
+            })
+            seen_names.add(name)
+            print(f"Found person: {name} - {title}")
+
+        print(f"Successfully extracted {len(recruiters)} unique recruiters")
+        return recruiters
+
+    def _extract_soup(self, html: str, strained: bool = False):
+        """Yield (name, title, profile url) for each profile container using BeautifulSoup"""
+        if strained:
+            soup = BeautifulSoup(html, 'html.parser', parse_only=RESULT_STRAINER)
+        else:
+            soup = BeautifulSoup(html, 'html.parser')
+
+        # Find all presence-entity divs (profile containers)
+        containers = soup.find_all('div', class_='presence-entity')
+        print(f"Found {len(containers)} profile containers")
+
+        # Result items are read once, however many containers they hold
+        item_details = {}
+
+        for container in containers:
+            # Get name from img alt attribute
+            img = container.find('img')
+            if not img or not img.get('alt'):
+                continue
+
+            # Get title and profile link from the enclosing result item
+            parent_container = container.find_parent('div', class_='entity-result__item')
+            if parent_container is None:
+                yield img.get('alt').strip(), "", ""
+                continue
+
+            key = id(parent_container)
+            if key not in item_details:
+                title_elem = parent_container.find('div', class_='entity-result__primary-subtitle')
+                link = parent_container.find('a', href=lambda href: href and '/in/' in href)
+                item_details[key] = (
+                    title_elem.get_text(strip=True) if title_elem else "",
+                    _profile_url(link.get('href')) if link else ""
+                )
+
+            title, linkedin_url = item_details[key]
+            yield img.get('alt').strip(), title, linkedin_url
+
+    def _extract_lxml(self, html: str):
+        """Yield (name, title, profile url) for each profile container using lxml"""
+        if not html or not html.strip():
+            print("Found 0 profile containers")
+            return
+
+        tree = lxml.html.fromstring(html)
+        containers = tree.xpath(
+            '//div[contains(concat(" ", normalize-space(@class), " "), " presence-entity ")]'
+        )
+        print(f"Found {len(containers)} profile containers")
+
+        item_details = {}
+
+        for container in containers:
+            img = next(container.iter('img'), None)
+            if img is None or not img.get('alt'):
+                continue
+
+            parent_container = self._lxml_result_item(container)
+            if parent_container is None:
+                yield img.get('alt').strip(), "", ""
+                continue
+
+            if parent_container not in item_details:
+                item_details[parent_container] = self._lxml_item_details(parent_container)
+
+            title, linkedin_url = item_details[parent_container]
+            yield img.get('alt').strip(), title, linkedin_url
+
+    @staticmethod
+    def _lxml_result_item(container):
+        """Walk up to the nearest entity-result__item ancestor"""
+        for ancestor in container.iterancestors('div'):
+            if _has_class(ancestor.get('class'), 'entity-result__item'):
+                return ancestor
+        return None
+
+    @staticmethod
+    def _lxml_item_details(item):
+        """Read title and profile link from a result item in one walk"""
+        title = None
+        linkedin_url = None
+        for element in item.iterdescendants('div', 'a'):
+            if (title is None and element.tag == 'div' and
+                    _has_class(element.get('class'), 'entity-result__primary-subtitle')):
+                title = HTMLProcessor._lxml_text(element)
+            elif linkedin_url is None and element.tag == 'a' and '/in/' in (element.get('href') or ''):
+                linkedin_url = _profile_url(element.get('href'))
+            if title is not None and linkedin_url is not None:
+                break
+        return title or "", linkedin_url or ""
+
+    @staticmethod
+    def _lxml_text(element) -> str:
+        """Equivalent of BeautifulSoup's get_text(strip=True)"""
+        parts = []
+
+        def collect(node):
+            if not isinstance(node.tag, str) or node.tag in NON_TEXT_TAGS:
+                return
+            parts.append(node.text)
+            for child in node:
+                collect(child)
+                parts.append(child.tail)
+
+        collect(element)
+        return ''.join(part.strip() for part in parts if part and part.strip())
+
 
 # Test code
 if __name__ == "__main__":
@@ -70,4 +279,4 @@ if __name__ == "__main__":
         for r in results:
             print(f"- {r['name']}: {r['title']}")
     else:
-        print("No recruiters found")
\ No newline at end of file
+        print("No recruiters found")
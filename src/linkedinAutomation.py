@@ -1,166 +1,561 @@
+import os
+import re
+import json
 import time
-from playwright.sync_api import Page
-from src.config import LINKEDIN_EMAIL, LINKEDIN_PASSWORD
+from typing import Union
+from urllib.parse import urlencode, urlparse, parse_qs, urlunparse
+from playwright.sync_api import Page, Browser, BrowserContext, Playwright
+from src.config import (LINKEDIN_EMAIL, LINKEDIN_PASSWORD, LINKEDIN_STORAGE_STATE, COMPANY_ID_CACHE,
+                        BLOCK_HEAVY_RESOURCES, RESOURCE_ALLOWLIST, HEADLESS, BROWSER_PROFILE_DIR)
+from src.utils.stepTimer import step_timer
+from src.utils.adaptivePacer import pacer, ChallengeError
+from src.utils.NameCleaner import NameCleaner
+from src.html_parser import SKIPPED_NAMES
+from src.voyager_parser import is_search_results_url
+
+RESULTS_CONTAINER = 'div.search-results-container'
+PAGE_STATE = '.artdeco-pagination__page-state'
+NEXT_BUTTON = 'button.artdeco-pagination__button--next.artdeco-button--muted'
+VISIBLE_DROPDOWN = 'div.artdeco-hoverable-content--visible'
+
+# Request types the parsers never look at; img[alt] is read from the DOM, not the image
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font'}
+FIRST_PARTY_DOMAINS = ('linkedin.com', 'licdn.com')
+
+PEOPLE_SEARCH_URL = 'https://www.linkedin.com/search/results/people/'
+US_GEO_URN = '103644278'  # "United States" in the location filter
+
+# Security checkpoints and CAPTCHAs LinkedIn shows when it throttles an account
+CHALLENGE_URL_MARKERS = ('/checkpoint/', '/authwall', 'captcha')
+CHALLENGE_SELECTOR = '#captcha-internal, iframe[src*="captcha"]'
+CHALLENGE_POLL_INTERVAL = 5  # Seconds between checks while waiting for a challenge to clear
+
+# True once the pagination state shows something other than the text passed in
+PAGE_STATE_CHANGED = """previous => {
+    const state = document.querySelector('.artdeco-pagination__page-state');
+    return state && state.innerText !== previous;
+}"""
+
 
 def login(page):
     try:
-        print("Attempting to log in...")
-
-        # Fill in email and password
-        email_field = page.wait_for_selector('input[name="session_key"]', timeout=10000)
-        print("Email field located")
-        password_field = page.wait_for_selector('input[name="session_password"]', timeout=10000)
-        print("Password field located")
-
-        email_field.fill(LINKEDIN_EMAIL)
-        print("Filled email")
-        password_field.fill(LINKEDIN_PASSWORD)
-        print("Filled password")
-        # Click sign in
-        sign_in = page.wait_for_selector('button[type="submit"]', timeout=10000)
-        sign_in.click()
-        print("Login submitted")
-
-        # Wait for successful login
-        page.wait_for_selector('#global-nav-typeahead', timeout=10000)
-        print("Login successful")
+        with step_timer.step('login'):
+            _login(page)
     except Exception as e:
         print(f"Login failed: {e}")
         raise e
 
 
-def search(page: Page, search_text: str):
+def _login(page):
+    print("Attempting to log in...")
+
+    # Fill in email and password
+    email_field = page.wait_for_selector('input[name="session_key"]', timeout=pacer.timeout_ms())
+    print("Email field located")
+    password_field = page.wait_for_selector('input[name="session_password"]', timeout=pacer.timeout_ms())
+    print("Password field located")
+
+    email_field.fill(LINKEDIN_EMAIL)
+    print("Filled email")
+    password_field.fill(LINKEDIN_PASSWORD)
+    print("Filled password")
+    # Click sign in
+    sign_in = page.wait_for_selector('button[type="submit"]', timeout=pacer.timeout_ms())
+    sign_in.click()
+    print("Login submitted")
+
+    # Wait for successful login
+    page.wait_for_selector('#global-nav-typeahead', timeout=pacer.timeout_ms())
+    print("Login successful")
+
+
+def new_session_context(browser: Browser) -> BrowserContext:
+    """Create a browser context, restoring the saved LinkedIn session if there is one"""
+    if os.path.exists(LINKEDIN_STORAGE_STATE):
+        try:
+            context = browser.new_context(storage_state=LINKEDIN_STORAGE_STATE)
+            print(f"Loaded saved session from {LINKEDIN_STORAGE_STATE}")
+            return context
+        except Exception as e:
+            print(f"Could not load saved session, starting fresh: {e}")
+    return browser.new_context()
+
+
+def save_session(context: BrowserContext):
+    """Persist cookies and local storage so the next run can skip login"""
     try:
-        print(f"Attempting to search for: {search_text}")
-        search_field = page.wait_for_selector('//*[@id="global-nav-typeahead"]/input')
-        search_field.fill(search_text)
-        print(f"Filled search field with: {search_text}")
+        os.makedirs(os.path.dirname(LINKEDIN_STORAGE_STATE) or '.', exist_ok=True)
+        context.storage_state(path=LINKEDIN_STORAGE_STATE)
+        print(f"Saved session to {LINKEDIN_STORAGE_STATE}")
+    except Exception as e:
+        print(f"Could not save session: {e}")
 
-        page.keyboard.press('Enter')
-        print("Pressed Enter")
-        time.sleep(3)  # Give search time to complete
 
-        # Look for the People button without waiting for network idle
+def launch_daemon_context(playwright: Playwright, port: int) -> BrowserContext:
+    """Start a persistent Chromium that other processes can attach to on the given port"""
+    context = playwright.chromium.launch_persistent_context(
+        BROWSER_PROFILE_DIR, headless=HEADLESS, args=[f'--remote-debugging-port={port}']
+    )
+
+    # Seed a fresh profile with the saved session cookies
+    if os.path.exists(LINKEDIN_STORAGE_STATE):
         try:
-            # From your error output, we can see the actual button text
-            people_button = page.wait_for_selector('button:has-text("People")', timeout=10000)
-            if people_button:
-                people_button.click()
-                print("Successfully clicked People filter")
-                time.sleep(2)
-            else:
-                print("People button found but null")
-                page.screenshot(path="null_button.png")
+            with open(LINKEDIN_STORAGE_STATE, encoding='utf-8') as f:
+                context.add_cookies(json.load(f).get('cookies', []))
         except Exception as e:
-            print(f"Failed to click People filter: {str(e)}")
-            page.screenshot(path="people_filter_error.png")
-            raise e
+            print(f"Could not load saved session cookies: {e}")
+    return context
+
+
+def connect_to_daemon(playwright: Playwright, cdp_url: str):
+    """Attach to a running browser daemon, returning (browser, context) or (None, None)"""
+    try:
+        browser = playwright.chromium.connect_over_cdp(cdp_url)
+        context = browser.contexts[0] if browser.contexts else browser.new_context()
+        print(f"Attached to browser daemon at {cdp_url}")
+        return browser, context
+    except Exception as e:
+        print(f"Could not attach to browser daemon at {cdp_url}, launching a browser: {e}")
+        return None, None
+
+
+def should_block(resource_type: str, url: str, allowlist=RESOURCE_ALLOWLIST) -> bool:
+    """Decide whether the scraping profile aborts a request"""
+    if any(fragment in url for fragment in allowlist):
+        return False
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+
+    host = urlparse(url).hostname or ''
+    first_party = any(host == domain or host.endswith('.' + domain) for domain in FIRST_PARTY_DOMAINS)
+    return not first_party
+
+
+def apply_scraping_profile(target: Union[BrowserContext, Page]):
+    """Abort heavy and third-party requests for every page in the context, or for one page
+
+    Applied after login so login and checkpoint pages still load normally.
+    Runs attached to the shared daemon context apply it per page, since page
+    routes go away with the page while context routes would pile up.
+    """
+    if not BLOCK_HEAVY_RESOURCES:
+        return
+
+    def handle(route):
+        if should_block(route.request.resource_type, route.request.url):
+            route.abort()
+        else:
+            route.continue_()
+
+    target.route('**/*', handle)
+    print("Blocking images, media, fonts and third-party requests")
+
+
+def ensure_logged_in(page: Page, check_session: bool = False):
+    """Reuse the saved session when it is still valid, otherwise log in and save it
+
+    With check_session the feed is checked even without a saved session file,
+    for browsers whose persistent profile keeps its own login.
+    """
+    if check_session or os.path.exists(LINKEDIN_STORAGE_STATE):
+        try:
+            with step_timer.step('session_check'):
+                page.goto('https://www.linkedin.com/feed/')
+                page.wait_for_selector('#global-nav-typeahead', timeout=pacer.timeout_ms())
+            print("Session is valid, skipping login")
+            return
+        except Exception:
+            print("Session is no longer valid, logging in again")
+
+    page.goto('https://linkedin.com/login')
+    login(page)
+    save_session(page.context)
+
+
+def is_challenge_page(page: Page) -> bool:
+    """True when LinkedIn is showing a checkpoint or CAPTCHA instead of the requested page"""
+    try:
+        if any(marker in page.url for marker in CHALLENGE_URL_MARKERS):
+            return True
+        return page.query_selector(CHALLENGE_SELECTOR) is not None
+    except Exception:
+        return False
+
+
+def start_challenge_cooldown(url: str) -> float:
+    """Back the pacer off for a challenge page; returns the deadline for it to clear"""
+    pacer.record_challenge()
+    print(f"LinkedIn challenge page at {url}, waiting up to {pacer.challenge_cooldown:.0f}s for it to clear")
+    return time.monotonic() + pacer.challenge_cooldown
+
+
+def check_challenge_deadline(deadline: float, url: str):
+    """Raise ChallengeError once a challenge has outlasted its cooldown"""
+    if time.monotonic() >= deadline:
+        raise ChallengeError(f"Challenge page did not clear: {url}")
+
+
+def next_page_retry_url(previous_url: str, page_state_text: str):
+    """URL of the page after the one whose pagination state is given, None without a state"""
+    current = re.search(r'Page\s+(\d+)', page_state_text or '')
+    return results_page_url(previous_url, int(current.group(1)) + 1) if current else None
+
+
+def guard_challenge(page: Page, retry_url: str = None) -> bool:
+    """Back off on a challenge page and wait for it to be cleared
+
+    Returns False when there is no challenge. Otherwise waits up to the
+    pacer's cooldown for the challenge to go away (it can be solved in the
+    browser window), reopens retry_url and returns True. Raises ChallengeError
+    when it does not clear, leaving the checkpoint for a later rerun.
+    """
+    if not is_challenge_page(page):
+        return False
+
+    deadline = start_challenge_cooldown(page.url)
+    while is_challenge_page(page):
+        check_challenge_deadline(deadline, page.url)
+        time.sleep(CHALLENGE_POLL_INTERVAL)
+
+    print("Challenge cleared")
+    if retry_url:
+        page.goto(retry_url)
+    return True
+
+
+def await_results(page: Page, wait, retry_url: str = None, retry_wait=None):
+    """Run a navigation wait timed by the pacer, recovering once from a challenge page
+
+    After a cleared challenge the page is reopened at retry_url and retry_wait
+    (default: wait) runs again.
+    """
+    try:
+        with pacer.measure():
+            wait()
+    except ChallengeError:
+        raise
+    except Exception:
+        if not guard_challenge(page, retry_url):
+            raise
+        (retry_wait or wait)()
+        return
+
+    if guard_challenge(page, retry_url):
+        (retry_wait or wait)()
+
+
+def search(page: Page, search_text: str):
+    try:
+        with step_timer.step('search'):
+            print(f"Attempting to search for: {search_text}")
+            search_field = page.wait_for_selector('//*[@id="global-nav-typeahead"]/input')
+            search_field.fill(search_text)
+            print(f"Filled search field with: {search_text}")
+
+            page.keyboard.press('Enter')
+            print("Pressed Enter")
+
+            # The People button appears once the search results page has loaded
+            try:
+                people_button = page.wait_for_selector('button:has-text("People")', timeout=pacer.timeout_ms())
+                if people_button:
+                    people_button.click()
+                    print("Successfully clicked People filter")
+                    page.wait_for_url('**/search/results/people/**', timeout=pacer.timeout_ms())
+                    page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms())
+                else:
+                    print("People button found but null")
+                    page.screenshot(path="null_button.png")
+            except Exception as e:
+                print(f"Failed to click People filter: {str(e)}")
+                page.screenshot(path="people_filter_error.png")
+                raise e
 
     except Exception as e:
         print(f"Search failed: {str(e)}")
         page.screenshot(path="search_error.png")
         raise e
 
+
+def _show_filter_results(page: Page, url_param: str):
+    """Click "Show results" in the open filter dropdown and wait for the filter to land in the URL"""
+    dropdown = page.wait_for_selector(VISIBLE_DROPDOWN, timeout=pacer.timeout_ms())
+    show_results_button = dropdown.wait_for_selector('button:has-text("Show results")', timeout=pacer.timeout_ms())
+    show_results_button.click()
+    page.wait_for_url(re.compile(rf'[?&]{url_param}='), timeout=pacer.timeout_ms())
+    page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms())
+
+
 def filter_recruiters(page: Page, company: str):
     try:
         print("Applying filters...")
 
-        location_field = page.wait_for_selector('//*[@id="searchFilter_geoUrn"]', timeout=10000)
-        location_field.click()
-        print("Location field clicked")
-        time.sleep(2)
+        with step_timer.step('filter_location'):
+            location_field = page.wait_for_selector('//*[@id="searchFilter_geoUrn"]', timeout=pacer.timeout_ms())
+            location_field.click()
+            print("Location field clicked")
 
-        us_location = page.wait_for_selector('.t-14:has-text("United States")', timeout=10000)
-        us_location.click()
-        print("United States location selected")
-        time.sleep(2)
+            us_location = page.wait_for_selector('.t-14:has-text("United States")', timeout=pacer.timeout_ms())
+            us_location.click()
+            print("United States location selected")
 
-        location_dropdown = page.wait_for_selector('div.artdeco-hoverable-content--visible', timeout=10000)
-        show_results_button = location_dropdown.query_selector('button:has-text("Show results")')
-        show_results_button.click()
-        print("Show results button clicked for location filter")
-        page.wait_for_selector('div.search-results-container', timeout=10000)
-        print("Results updated for location filter")
+            _show_filter_results(page, 'geoUrn')
+            print("Results updated for location filter")
 
-        time.sleep(5)
+        with step_timer.step('filter_company'):
+            current_company_field = page.wait_for_selector('//*[@id="searchFilter_currentCompany"]', timeout=pacer.timeout_ms())
+            current_company_field.click()
+            print("Current company filter clicked")
 
-        current_company_field = page.wait_for_selector('//*[@id="searchFilter_currentCompany"]', timeout=10000)
-        current_company_field.click()
-        print("Current company filter clicked")
-        time.sleep(2)
+            search_given_company = page.wait_for_selector('#hoverable-outlet-current-company-filter-value .search-basic-typeahead input', timeout=pacer.timeout_ms())
+            search_given_company.fill(company)
+            print(f"Filled company: {company}")
 
-        search_given_company = page.wait_for_selector('#hoverable-outlet-current-company-filter-value .search-basic-typeahead input', timeout=10000)
-        search_given_company.fill(company)
-        print(f"Filled company: {company}")
-        time.sleep(2)
+            current_company_suggestion = page.wait_for_selector('#hoverable-outlet-current-company-filter-value .basic-typeahead__selectable', timeout=pacer.timeout_ms())
+            current_company_suggestion.click()
+            print("Current company selected from suggestions")
 
-        current_company_suggestion = page.wait_for_selector('#hoverable-outlet-current-company-filter-value .basic-typeahead__selectable', timeout=10000)
-        current_company_suggestion.click()
-        print("Current company selected from suggestions")
-
-        company_dropdown = page.wait_for_selector('div.artdeco-hoverable-content--visible', timeout=10000)
-        show_results_button = company_dropdown.query_selector('button:has-text("Show results")')
-        show_results_button.click()
-        print("Show results button clicked for company filter")
-        page.wait_for_selector('div.search-results-container', timeout=10000)
-        print("Results updated for company filter")
-
-        time.sleep(5)
+            _show_filter_results(page, 'currentCompany')
+            print("Results updated for company filter")
 
         print("Filters applied and dropdown closed")
     except Exception as e:
         print(f"Filter application failed: {e}")
 
 
-def goto_next_page(page: Page) -> bool:
-    """Navigate to the next page of search results"""
-    try:
-        print("Attempting to go to next page...")
-
-        # First check if there are more pages
-        page_state = page.query_selector('.artdeco-pagination__page-state')
-        if page_state:
-            text = page_state.inner_text()
-            print(f"Found pagination state: {text}")
-            if "Page 1 of 1" in text:
-                print("Only one page available")
-                return False
+def listen_for_search_results(page: Page) -> list:
+    """Collect people-search API responses as the page receives them
 
-        # Scroll to ensure pagination is in view
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(2)
+    The returned list fills up in the background; read bodies from the main
+    flow with response.json() before navigating away, then clear it.
+    """
+    responses = []
 
-        # Look for the next button using exact classes
-        next_button = page.query_selector(
-            'button.artdeco-pagination__button--next.artdeco-button--muted'
-        )
+    def on_response(response):
+        if is_search_results_url(response.url):
+            responses.append(response)
 
-        if not next_button:
-            print("Next button not found")
-            return False
+    page.on('response', on_response)
+    return responses
 
-        # Check if button is disabled
-        is_disabled = next_button.get_attribute('disabled')
-        if is_disabled:
-            print("Next button is disabled")
-            return False
 
-        # Click the button
-        print("Clicking next button")
-        next_button.click()
+def known_fraction(page: Page, known_names: set) -> float:
+    """Fraction of the people on the current results page whose cleaned name is already known"""
+    names = page.eval_on_selector_all(
+        'div.presence-entity img[alt]', 'images => images.map(img => img.alt.trim())'
+    )
+    cleaned = [NameCleaner.clean_name(name) for name in names if name and name not in SKIPPED_NAMES]
+    cleaned = [c['full_name'] for c in cleaned if c]
+    if not cleaned:
+        return 0.0
+    return sum(1 for name in cleaned if name in known_names) / len(cleaned)
 
-        # Wait for page state to update
-        time.sleep(2)
 
-        # Verify we moved to next page by checking page state again
-        new_page_state = page.query_selector('.artdeco-pagination__page-state')
-        if new_page_state:
-            new_text = new_page_state.inner_text()
-            print(f"New page state: {new_text}")
+def goto_next_page(page: Page, known_names: set = None, stop_fraction: float = 1.0) -> bool:
+    """Navigate to the next page of search results
 
-        return True
+    When known_names is given, paging stops early once at least stop_fraction of
+    the current page is already known.
+    """
+    try:
+        if known_names:
+            fraction = known_fraction(page, known_names)
+            if fraction >= stop_fraction:
+                print(f"{fraction:.0%} of this page is already known, stopping here")
+                return False
 
+        with step_timer.step('next_page'):
+            return _goto_next_page(page)
+
+    except ChallengeError:
+        raise
     except Exception as e:
         print(f"Error navigating to next page: {e}")
         page.screenshot(path="next_page_error.png")
         return False
+
+
+def _goto_next_page(page: Page) -> bool:
+    print("Attempting to go to next page...")
+
+    # First check if there are more pages
+    page_state = page.query_selector(PAGE_STATE)
+    text = None
+    if page_state:
+        text = page_state.inner_text()
+        print(f"Found pagination state: {text}")
+        if "Page 1 of 1" in text:
+            print("Only one page available")
+            return False
+
+    # Scroll to ensure pagination is in view
+    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+    # Look for the next button using exact classes
+    try:
+        next_button = page.wait_for_selector(NEXT_BUTTON, state='visible', timeout=5000)
+    except Exception:
+        next_button = None
+
+    if not next_button:
+        print("Next button not found")
+        return False
+
+    # Check if button is disabled
+    is_disabled = next_button.get_attribute('disabled')
+    if is_disabled:
+        print("Next button is disabled")
+        return False
+
+    # Click the button
+    pacer.pause()
+    print("Clicking next button")
+    previous_url = page.url
+    next_button.click()
+
+    # After a cleared challenge, reopen the page we were heading to by URL
+    retry_url = next_page_retry_url(previous_url, text)
+
+    # Wait until the pagination state (or the URL when there is none) moves on
+    def wait():
+        if text is not None:
+            page.wait_for_function(PAGE_STATE_CHANGED, arg=text, timeout=pacer.timeout_ms())
+        else:
+            page.wait_for_url(lambda url: url != previous_url, timeout=pacer.timeout_ms())
+        page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms())
+
+    await_results(page, wait, retry_url,
+                  retry_wait=lambda: page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms()))
+
+    # Verify we moved to next page by checking page state again
+    new_page_state = page.query_selector(PAGE_STATE)
+    if new_page_state:
+        new_text = new_page_state.inner_text()
+        print(f"New page state: {new_text}")
+
+    return True
+
+
+def build_people_search_url(keywords: str, company_id: str = None, geo_urn: str = US_GEO_URN,
+                            page_num: int = 1) -> str:
+    """Build the filtered people-search results URL the filter dropdowns would produce"""
+    params = {'keywords': keywords, 'origin': 'FACETED_SEARCH'}
+    if geo_urn:
+        params['geoUrn'] = json.dumps([geo_urn])
+    if company_id:
+        params['currentCompany'] = json.dumps([company_id])
+    if page_num > 1:
+        params['page'] = page_num
+    return f"{PEOPLE_SEARCH_URL}?{urlencode(params)}"
+
+
+def company_id_from_url(url: str):
+    """Read the current-company filter ID out of a people-search URL"""
+    values = parse_qs(urlparse(url).query).get('currentCompany')
+    if not values:
+        return None
+    try:
+        ids = json.loads(values[0])
+        return str(ids[0]) if ids else None
+    except (ValueError, IndexError, TypeError):
+        return None
+
+
+def _company_key(company: str) -> str:
+    return company.strip().lower()
+
+
+def load_company_ids() -> dict:
+    """Load the company name -> filter ID cache"""
+    try:
+        with open(COMPANY_ID_CACHE, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Error loading company ID cache: {e}")
+        return {}
+
+
+def get_cached_company_id(company: str):
+    return load_company_ids().get(_company_key(company))
+
+
+def cache_company_id(company: str, company_id: str):
+    """Remember a resolved filter ID for later runs"""
+    try:
+        company_ids = load_company_ids()
+        company_ids[_company_key(company)] = company_id
+        os.makedirs(os.path.dirname(COMPANY_ID_CACHE) or '.', exist_ok=True)
+        with open(COMPANY_ID_CACHE, 'w', encoding='utf-8') as f:
+            json.dump(company_ids, f, indent=2, sort_keys=True)
+        print(f"Cached company ID {company_id} for {company}")
+    except Exception as e:
+        print(f"Error saving company ID cache: {e}")
+
+
+def open_people_search(page: Page, company: str, search_text: str):
+    """Open the filtered people results for a company and keyword search
+
+    With a cached company ID this is a single navigation. Otherwise the ID is
+    resolved once through the search and filter typeaheads and cached.
+    """
+    company_id = get_cached_company_id(company)
+    if company_id:
+        url = build_people_search_url(search_text, company_id)
+        pacer.pause()
+        with step_timer.step('search'):
+            print(f"Opening people search for: {search_text}")
+            page.goto(url)
+            await_results(page, lambda: page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms()), url)
+        return
+
+    print(f"No cached company ID for {company}, resolving through the filters")
+    search(page, search_text)
+    filter_recruiters(page, company)
+
+    company_id = company_id_from_url(page.url)
+    if company_id:
+        cache_company_id(company, company_id)
+    else:
+        print(f"Could not read company ID for {company} from {page.url}")
+
+
+def read_page_count(page: Page):
+    """Total number of result pages from the pagination state, None if it isn't shown"""
+    page_state = page.query_selector(PAGE_STATE)
+    if not page_state:
+        return None
+    match = re.search(r'of\s+(\d+)', page_state.inner_text())
+    return int(match.group(1)) if match else None
+
+
+def last_page_reached(page: Page, page_num: int) -> bool:
+    """True if page_num is the last results page; without pagination there is only page 1"""
+    page_count = read_page_count(page)
+    if page_count is None:
+        return page_num == 1
+    return page_num >= page_count
+
+
+def results_page_url(url: str, page_num: int) -> str:
+    """The same search URL pointed at another results page"""
+    parsed = urlparse(url)
+    params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+    params['page'] = str(page_num)
+    return urlunparse(parsed._replace(query=urlencode(params)))
+
+
+def start_results_page(page: Page, url: str):
+    """Begin loading a results page without waiting for it to render"""
+    page.goto(url, wait_until='commit')
+
+
+def wait_for_results(page: Page):
+    """Wait until a results page started with start_results_page has rendered its results"""
+    url = page.url
+    await_results(page, lambda: page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms()), url)
+    try:
+        page.wait_for_selector('div.entity-result__item', timeout=5000)
+    except Exception:
+        print(f"No result items rendered on {page.url}")
@@ -0,0 +1,302 @@
+import asyncio
+import os
+import re
+from playwright.async_api import Page, Browser, BrowserContext
+from src.config import LINKEDIN_EMAIL, LINKEDIN_PASSWORD, LINKEDIN_STORAGE_STATE, BLOCK_HEAVY_RESOURCES
+from src.linkedinAutomation import (RESULTS_CONTAINER, PAGE_STATE, NEXT_BUTTON, VISIBLE_DROPDOWN,
+                                    CHALLENGE_URL_MARKERS, CHALLENGE_SELECTOR, CHALLENGE_POLL_INTERVAL,
+                                    PAGE_STATE_CHANGED, start_challenge_cooldown, check_challenge_deadline,
+                                    next_page_retry_url,
+                                    build_people_search_url, company_id_from_url,
+                                    get_cached_company_id, cache_company_id, should_block)
+from src.utils.stepTimer import step_timer
+from src.utils.adaptivePacer import pacer, ChallengeError
+
+# Async counterparts of src/linkedinAutomation.py, used when several tabs
+# share one browser. Keep the selectors in step with the sync module.
+
+
+async def login(page: Page):
+    try:
+        print("Attempting to log in...")
+
+        # Fill in email and password
+        email_field = await page.wait_for_selector('input[name="session_key"]', timeout=pacer.timeout_ms())
+        print("Email field located")
+        password_field = await page.wait_for_selector('input[name="session_password"]', timeout=pacer.timeout_ms())
+        print("Password field located")
+
+        await email_field.fill(LINKEDIN_EMAIL)
+        print("Filled email")
+        await password_field.fill(LINKEDIN_PASSWORD)
+        print("Filled password")
+        # Click sign in
+        sign_in = await page.wait_for_selector('button[type="submit"]', timeout=pacer.timeout_ms())
+        await sign_in.click()
+        print("Login submitted")
+
+        # Wait for successful login
+        await page.wait_for_selector('#global-nav-typeahead', timeout=pacer.timeout_ms())
+        print("Login successful")
+    except Exception as e:
+        print(f"Login failed: {e}")
+        raise e
+
+
+async def new_session_context(browser: Browser) -> BrowserContext:
+    """Create a browser context, restoring the saved LinkedIn session if there is one"""
+    if os.path.exists(LINKEDIN_STORAGE_STATE):
+        try:
+            context = await browser.new_context(storage_state=LINKEDIN_STORAGE_STATE)
+            print(f"Loaded saved session from {LINKEDIN_STORAGE_STATE}")
+            return context
+        except Exception as e:
+            print(f"Could not load saved session, starting fresh: {e}")
+    return await browser.new_context()
+
+
+async def save_session(context: BrowserContext):
+    """Persist cookies and local storage so the next run can skip login"""
+    try:
+        os.makedirs(os.path.dirname(LINKEDIN_STORAGE_STATE) or '.', exist_ok=True)
+        await context.storage_state(path=LINKEDIN_STORAGE_STATE)
+        print(f"Saved session to {LINKEDIN_STORAGE_STATE}")
+    except Exception as e:
+        print(f"Could not save session: {e}")
+
+
+async def apply_scraping_profile(context: BrowserContext):
+    """Abort heavy and third-party requests for every page in the context"""
+    if not BLOCK_HEAVY_RESOURCES:
+        return
+
+    async def handle(route):
+        if should_block(route.request.resource_type, route.request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route('**/*', handle)
+    print("Blocking images, media, fonts and third-party requests")
+
+
+async def ensure_logged_in(page: Page):
+    """Reuse the saved session when it is still valid, otherwise log in and save it"""
+    if os.path.exists(LINKEDIN_STORAGE_STATE):
+        try:
+            with step_timer.step('session_check'):
+                await page.goto('https://www.linkedin.com/feed/')
+                await page.wait_for_selector('#global-nav-typeahead', timeout=pacer.timeout_ms())
+            print("Saved session is valid, skipping login")
+            return
+        except Exception:
+            print("Saved session is no longer valid, logging in again")
+
+    await page.goto('https://linkedin.com/login')
+    with step_timer.step('login'):
+        await login(page)
+    await save_session(page.context)
+
+
+async def is_challenge_page(page: Page) -> bool:
+    """True when LinkedIn is showing a checkpoint or CAPTCHA instead of the requested page"""
+    try:
+        if any(marker in page.url for marker in CHALLENGE_URL_MARKERS):
+            return True
+        return await page.query_selector(CHALLENGE_SELECTOR) is not None
+    except Exception:
+        return False
+
+
+async def guard_challenge(page: Page, retry_url: str = None) -> bool:
+    """Back off on a challenge page and wait for it to be cleared, as the sync guard_challenge"""
+    if not await is_challenge_page(page):
+        return False
+
+    deadline = start_challenge_cooldown(page.url)
+    while await is_challenge_page(page):
+        check_challenge_deadline(deadline, page.url)
+        await asyncio.sleep(CHALLENGE_POLL_INTERVAL)
+
+    print("Challenge cleared")
+    if retry_url:
+        await page.goto(retry_url)
+    return True
+
+
+async def await_results(page: Page, wait, retry_url: str = None, retry_wait=None):
+    """Await a navigation wait timed by the pacer, recovering once from a challenge page
+
+    wait and retry_wait are coroutine functions; see the sync await_results.
+    """
+    try:
+        with pacer.measure():
+            await wait()
+    except ChallengeError:
+        raise
+    except Exception:
+        if not await guard_challenge(page, retry_url):
+            raise
+        await (retry_wait or wait)()
+        return
+
+    if await guard_challenge(page, retry_url):
+        await (retry_wait or wait)()
+
+
+async def search(page: Page, search_text: str):
+    try:
+        with step_timer.step('search'):
+            print(f"Attempting to search for: {search_text}")
+            search_field = await page.wait_for_selector('//*[@id="global-nav-typeahead"]/input')
+            await search_field.fill(search_text)
+            print(f"Filled search field with: {search_text}")
+
+            await page.keyboard.press('Enter')
+            print("Pressed Enter")
+
+            # The People button appears once the search results page has loaded
+            try:
+                people_button = await page.wait_for_selector('button:has-text("People")', timeout=pacer.timeout_ms())
+                if people_button:
+                    await people_button.click()
+                    print("Successfully clicked People filter")
+                    await page.wait_for_url('**/search/results/people/**', timeout=pacer.timeout_ms())
+                    await page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms())
+                else:
+                    print("People button found but null")
+            except Exception as e:
+                print(f"Failed to click People filter: {str(e)}")
+                raise e
+
+    except Exception as e:
+        print(f"Search failed: {str(e)}")
+        raise e
+
+
+async def _show_filter_results(page: Page, url_param: str):
+    """Click "Show results" in the open filter dropdown and wait for the filter to land in the URL"""
+    dropdown = await page.wait_for_selector(VISIBLE_DROPDOWN, timeout=pacer.timeout_ms())
+    show_results_button = await dropdown.wait_for_selector('button:has-text("Show results")', timeout=pacer.timeout_ms())
+    await show_results_button.click()
+    await page.wait_for_url(re.compile(rf'[?&]{url_param}='), timeout=pacer.timeout_ms())
+    await page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms())
+
+
+async def filter_recruiters(page: Page, company: str):
+    try:
+        print("Applying filters...")
+
+        with step_timer.step('filter_location'):
+            location_field = await page.wait_for_selector('//*[@id="searchFilter_geoUrn"]', timeout=pacer.timeout_ms())
+            await location_field.click()
+            print("Location field clicked")
+
+            us_location = await page.wait_for_selector('.t-14:has-text("United States")', timeout=pacer.timeout_ms())
+            await us_location.click()
+            print("United States location selected")
+
+            await _show_filter_results(page, 'geoUrn')
+            print("Results updated for location filter")
+
+        with step_timer.step('filter_company'):
+            current_company_field = await page.wait_for_selector('//*[@id="searchFilter_currentCompany"]', timeout=pacer.timeout_ms())
+            await current_company_field.click()
+            print("Current company filter clicked")
+
+            search_given_company = await page.wait_for_selector('#hoverable-outlet-current-company-filter-value .search-basic-typeahead input', timeout=pacer.timeout_ms())
+            await search_given_company.fill(company)
+            print(f"Filled company: {company}")
+
+            current_company_suggestion = await page.wait_for_selector('#hoverable-outlet-current-company-filter-value .basic-typeahead__selectable', timeout=pacer.timeout_ms())
+            await current_company_suggestion.click()
+            print("Current company selected from suggestions")
+
+            await _show_filter_results(page, 'currentCompany')
+            print("Results updated for company filter")
+
+        print("Filters applied and dropdown closed")
+    except Exception as e:
+        print(f"Filter application failed: {e}")
+
+
+async def goto_next_page(page: Page) -> bool:
+    """Navigate to the next page of search results"""
+    try:
+        with step_timer.step('next_page'):
+            # First check if there are more pages
+            page_state = await page.query_selector(PAGE_STATE)
+            text = None
+            if page_state:
+                text = await page_state.inner_text()
+                if "Page 1 of 1" in text:
+                    print("Only one page available")
+                    return False
+
+            # Scroll to ensure pagination is in view
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+            try:
+                next_button = await page.wait_for_selector(NEXT_BUTTON, state='visible', timeout=5000)
+            except Exception:
+                next_button = None
+
+            if not next_button:
+                print("Next button not found")
+                return False
+
+            if await next_button.get_attribute('disabled'):
+                print("Next button is disabled")
+                return False
+
+            await asyncio.sleep(pacer.delay)
+            previous_url = page.url
+            await next_button.click()
+
+            # Wait until the pagination state (or the URL when there is none) moves on
+            async def wait():
+                if text is not None:
+                    await page.wait_for_function(PAGE_STATE_CHANGED, arg=text, timeout=pacer.timeout_ms())
+                else:
+                    await page.wait_for_url(lambda url: url != previous_url, timeout=pacer.timeout_ms())
+                await page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms())
+
+            async def wait_for_container():
+                await page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms())
+
+            # After a cleared challenge, reopen the page we were heading to by URL
+            await await_results(page, wait, next_page_retry_url(previous_url, text), retry_wait=wait_for_container)
+            return True
+
+    except ChallengeError:
+        raise
+    except Exception as e:
+        print(f"Error navigating to next page: {e}")
+        return False
+
+
+async def open_people_search(page: Page, company: str, search_text: str):
+    """Open the filtered people results, resolving and caching the company ID on first use"""
+    company_id = get_cached_company_id(company)
+    if company_id:
+        await asyncio.sleep(pacer.delay)
+        with step_timer.step('search'):
+            print(f"Opening people search for: {search_text}")
+            url = build_people_search_url(search_text, company_id)
+            await page.goto(url)
+
+            async def wait_for_container():
+                await page.wait_for_selector(RESULTS_CONTAINER, timeout=pacer.timeout_ms())
+
+            await await_results(page, wait_for_container, url)
+        return
+
+    print(f"No cached company ID for {company}, resolving through the filters")
+    await search(page, search_text)
+    await filter_recruiters(page, company)
+
+    company_id = company_id_from_url(page.url)
+    if company_id:
+        cache_company_id(company, company_id)
+    else:
+        print(f"Could not read company ID for {company} from {page.url}")
@@ -0,0 +1,76 @@
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+
+class PageCorpus:
+    """Compressed, content-addressed store of captured results pages
+
+    Layout under the corpus root:
+        objects/ab/<sha256>.gz  - gzip compressed HTML or PDF, named by content hash
+        index.jsonl             - one metadata record per captured page
+    Identical pages captured again only add an index record.
+    """
+
+    def __init__(self, root: str = "data/corpus"):
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], f"{digest}.gz")
+
+    def _store(self, content: bytes) -> str:
+        """Write content once under its hash and return the hash"""
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        return digest
+
+    def _read(self, digest: str) -> bytes:
+        with gzip.open(self._object_path(digest), 'rb') as f:
+            return f.read()
+
+    def record(self, html: str, company: str, role: str, page_num: int,
+               pdf: Optional[bytes] = None) -> Dict:
+        """Store a page snapshot and append its metadata to the index"""
+        entry = {
+            'html': self._store(html.encode('utf-8')),
+            'pdf': self._store(pdf) if pdf else None,
+            'company': company,
+            'role': role,
+            'page_num': page_num,
+            'captured_at': datetime.now().isoformat()
+        }
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+        return entry
+
+    def entries(self, company: Optional[str] = None) -> Iterator[Dict]:
+        """Iterate index records, optionally for one company"""
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if company is None or entry['company'].lower() == company.lower():
+                    yield entry
+
+    def load(self, entry: Dict) -> Dict:
+        """Rebuild the snapshot dict the scraper captured for an index record"""
+        return {
+            'role': entry['role'],
+            'page_num': entry['page_num'],
+            'html': self._read(entry['html']).decode('utf-8'),
+            'pdf': self._read(entry['pdf']) if entry.get('pdf') else None
+        }
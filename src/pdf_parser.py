@@ -1,6 +1,7 @@
+import io
 import os
 import pdfplumber
-from typing import List, Dict
+from typing import List, Dict, Iterable
 
 class PDFProcessor:
     def __init__(self):
@@ -14,18 +15,94 @@ class PDFProcessor:
                 print(f"PDF file not found: {pdf_path}")
                 return recruiters
 
-            with pdfplumber.open(pdf_path) as pdf:
+            return self._process_pdf(pdf_path)
+
+        except Exception as e:
+            print(f"Error processing PDF file: {e}")
+            return []
+
+    def process_bytes(self, pdf_bytes: bytes) -> List[Dict[str, str]]:
+        """Process a PDF rendered in memory (e.g. the return value of page.pdf())"""
+        try:
+            if not pdf_bytes:
+                print("Empty PDF content")
+                return []
+
+            return self._process_pdf(io.BytesIO(pdf_bytes))
+
+        except Exception as e:
+            print(f"Error processing PDF content: {e}")
+            return []
+
+    def find_titles(self, source, names: Iterable[str]) -> Dict[str, str]:
+        """Look up titles for specific recruiters only.
+
+        source is a PDF path or the bytes returned by page.pdf(). Words are
+        extracted from the results region of each page (the band holding the
+        result separators) and the scan stops once every name is resolved.
+        """
+        wanted = {name for name in names if name and name != "LinkedIn Member"}
+        titles = {}
+        if not wanted:
+            return titles
+
+        try:
+            if isinstance(source, (bytes, bytearray)):
+                source = io.BytesIO(source)
+            elif not os.path.exists(source):
+                print(f"PDF file not found: {source}")
+                return titles
+
+            with pdfplumber.open(source) as pdf:
                 for page_num, page in enumerate(pdf.pages):
-                    page_recruiters = self._process_page(page, page_num)
-                    recruiters.extend(page_recruiters)
+                    for line in self._results_lines(page):
+                        recruiter = self._process_line(line)
+                        if recruiter and recruiter['name'] in wanted and recruiter['title']:
+                            titles.setdefault(recruiter['name'], recruiter['title'])
 
-            print(f"Found {len(recruiters)} recruiters in PDF")
-            return recruiters
+                    if len(titles) == len(wanted):
+                        break
+
+            print(f"Resolved {len(titles)}/{len(wanted)} missing titles from PDF")
 
         except Exception as e:
-            print(f"Error processing PDF file: {e}")
+            print(f"Error looking up titles in PDF: {e}")
+
+        return titles
+
+    def _results_lines(self, page) -> List[str]:
+        """Rebuild text lines from words inside the results region of a page"""
+        marker = self.separator.strip()
+        separator_chars = [c for c in page.chars if c['text'] == marker]
+        if not separator_chars:
             return []
 
+        # Results region: the vertical band between the first and last separator
+        line_height = max(c['bottom'] - c['top'] for c in separator_chars)
+        top = max(0, min(c['top'] for c in separator_chars) - line_height)
+        bottom = min(page.height, max(c['bottom'] for c in separator_chars) + line_height)
+        region = page.crop((0, top, page.width, bottom))
+
+        lines = {}
+        for word in region.extract_words():
+            # Words on the same baseline (within pdfplumber's default tolerance) form a line
+            key = next((k for k in lines if abs(k - word['top']) <= 3), word['top'])
+            lines.setdefault(key, []).append(word)
+
+        return [' '.join(w['text'] for w in sorted(words, key=lambda w: w['x0']))
+                for _, words in sorted(lines.items())]
+
+    def _process_pdf(self, source) -> List[Dict[str, str]]:
+        """Extract recruiters from every page of a PDF path or file-like object"""
+        recruiters = []
+        with pdfplumber.open(source) as pdf:
+            for page_num, page in enumerate(pdf.pages):
+                page_recruiters = self._process_page(page, page_num)
+                recruiters.extend(page_recruiters)
+
+        print(f"Found {len(recruiters)} recruiters in PDF")
+        return recruiters
+
     def _process_page(self, page, page_num: int) -> List[Dict[str, str]]:
         """Process a single PDF page"""
         recruiters = []
@@ -0,0 +1,323 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+import pandas as pd
+from src.config import RECRUITER_DB
+
+try:
+    import pyarrow
+except ImportError:  # pyarrow is optional, workbooks are then exported without a Parquet mirror
+    pyarrow = None
+
+# Recruiter table columns, in the order of the exported workbook
+COLUMNS = {
+    'Full Name': 'full_name',
+    'First Name': 'first_name',
+    'Middle Name': 'middle_name',
+    'Last Name': 'last_name',
+    'Title': 'title',
+    'Role': 'role',
+    'Email': 'email',
+    'Email Status': 'email_status',  # verified, unavailable, or fallback
+    'Email Source': 'email_source',  # apollo or fallback
+    'LinkedIn URL': 'linkedin_url',
+    'Headline': 'headline',
+    'Company': 'company',
+    'Status': 'status',
+    'Last Updated': 'last_updated',
+    'Email_Draft': 'email_draft',
+    'Email_Sent': 'email_sent',
+    'Email_Sent_Date': 'email_sent_date'
+}
+
+# Added to the workbook by later stages, exported only once a stage has filled them
+STAGE_COLUMNS = ['Email_Draft', 'Email_Sent', 'Email_Sent_Date']
+
+# Low-cardinality columns stored as categoricals in columnar copies and reports
+CATEGORY_COLUMNS = ['Company', 'Email Status', 'Email Source', 'Status', 'Role']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS recruiters (
+    id INTEGER PRIMARY KEY,
+    company TEXT NOT NULL,
+    full_name TEXT NOT NULL,
+    first_name TEXT,
+    middle_name TEXT,
+    last_name TEXT,
+    title TEXT,
+    role TEXT,
+    email TEXT,
+    email_status TEXT,
+    email_source TEXT,
+    linkedin_url TEXT,
+    headline TEXT,
+    status TEXT,
+    last_updated TEXT,
+    email_draft TEXT,
+    email_sent INTEGER NOT NULL DEFAULT 0,
+    email_sent_date TEXT,
+    UNIQUE (company, full_name)
+);
+CREATE INDEX IF NOT EXISTS idx_recruiters_email ON recruiters (email);
+CREATE INDEX IF NOT EXISTS idx_recruiters_email_status ON recruiters (company, email_status);
+CREATE INDEX IF NOT EXISTS idx_recruiters_email_source ON recruiters (company, email_source);
+CREATE INDEX IF NOT EXISTS idx_recruiters_email_sent ON recruiters (company, email_sent);
+"""
+
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the low-cardinality recruiter columns to categoricals"""
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
+
+
+def columnar_path(path: str) -> str:
+    """Parquet mirror of a recruiters workbook: recruiters.xlsx -> recruiters.parquet"""
+    return os.path.splitext(path)[0] + '.parquet'
+
+
+def read_workbook(path: str) -> pd.DataFrame:
+    """Read a recruiters workbook, from its Parquet mirror when that is newer"""
+    mirror = columnar_path(path)
+    if pyarrow is not None and os.path.exists(mirror) and (
+            not os.path.exists(path) or os.path.getmtime(mirror) >= os.path.getmtime(path)):
+        return pd.read_parquet(mirror)
+    return pd.read_excel(path)
+
+
+def _to_sql(value):
+    """SQLite friendly version of a DataFrame cell"""
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return str(value)
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    if hasattr(value, 'item'):
+        value = value.item()  # numpy scalars
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+class RecruiterStore:
+    """SQLite system of record for every company's recruiters
+
+    One row per (company, full name). Stages read a company as a DataFrame
+    with the workbook's column names and write back only the rows they
+    changed, so they never rewrite a whole table and can run side by side.
+    The workbook layout is produced on demand by export(), together with a
+    Parquet mirror. A company that only has a recruiters.xlsx from before the
+    store is imported on first use.
+    """
+
+    def __init__(self, path: str = "data/recruiters.db"):
+        self.path = path
+
+    @contextmanager
+    def _connection(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def legacy_path(company: str) -> str:
+        return f"data/{company}/recruiters.xlsx"
+
+    def _count(self, conn, company: str) -> int:
+        return conn.execute("SELECT COUNT(*) FROM recruiters WHERE company = ?", (company,)).fetchone()[0]
+
+    def _ensure_imported(self, company: str, legacy_path: str = None):
+        """Import a pre-store workbook the first time a company is used"""
+        legacy_path = legacy_path or self.legacy_path(company)
+        with self._connection() as conn:
+            if self._count(conn, company) or not (
+                    os.path.exists(legacy_path) or os.path.exists(columnar_path(legacy_path))):
+                return
+        self.import_excel(company, legacy_path)
+
+    def import_excel(self, company: str, path: str) -> int:
+        """Load a recruiters workbook into the store, keeping rows already stored"""
+        df = read_workbook(path)
+        count = self.insert_new(company, df)
+        print(f"Imported {count} recruiters for {company} from {path}")
+        return count
+
+    def exists(self, company: str) -> bool:
+        self._ensure_imported(company)
+        with self._connection() as conn:
+            return self._count(conn, company) > 0
+
+    def companies(self) -> List[str]:
+        with self._connection() as conn:
+            return [row[0] for row in conn.execute("SELECT DISTINCT company FROM recruiters ORDER BY company")]
+
+    def load(self, company: str, legacy_path: str = None) -> pd.DataFrame:
+        """A company's recruiters with the workbook's column names, in insertion order"""
+        self._ensure_imported(company, legacy_path)
+        with self._connection() as conn:
+            df = pd.read_sql_query(
+                f"SELECT {', '.join(COLUMNS.values())} FROM recruiters WHERE company = ? ORDER BY id",
+                conn, params=(company,)
+            )
+        df.columns = list(COLUMNS)
+        df['Email_Sent'] = df['Email_Sent'].astype(bool)
+        return df
+
+    def load_all(self) -> pd.DataFrame:
+        """Every company's recruiters in one DataFrame with compact dtypes, for reporting"""
+        with self._connection() as conn:
+            df = pd.read_sql_query(f"SELECT {', '.join(COLUMNS.values())} FROM recruiters ORDER BY id", conn)
+        df.columns = list(COLUMNS)
+        df['Email_Sent'] = df['Email_Sent'].astype(bool)
+        return compact_dtypes(df)
+
+    def summary(self, company: str) -> Dict[str, int]:
+        """Recruiter counts by email source and status, counted in the database"""
+        self._ensure_imported(company)
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(email_source = 'apollo'), 0), "
+                "COALESCE(SUM(email_source = 'fallback'), 0), "
+                "COALESCE(SUM(email_status = 'verified'), 0), "
+                "COALESCE(SUM(email_sent), 0) "
+                "FROM recruiters WHERE company = ?", (company,)
+            ).fetchone()
+        return dict(zip(['total', 'apollo', 'fallback', 'verified', 'sent'], row))
+
+    def full_names(self, company: str) -> set:
+        self._ensure_imported(company)
+        with self._connection() as conn:
+            rows = conn.execute("SELECT full_name FROM recruiters WHERE company = ?", (company,))
+            return {row[0] for row in rows}
+
+    def _rows(self, company: str, df: pd.DataFrame) -> Tuple[List[str], List[tuple]]:
+        """Database columns and values for the workbook columns present in df"""
+        if 'Full Name' not in df.columns:
+            raise ValueError("Recruiter rows need a 'Full Name' column")
+        names = [name for name in COLUMNS if name in df.columns and name != 'Company']
+        columns = ['company'] + [COLUMNS[name] for name in names]
+        sent = names.index('Email_Sent') if 'Email_Sent' in names else None
+
+        values = []
+        for row in df[names].itertuples(index=False, name=None):
+            row = [_to_sql(value) for value in row]
+            if row[0] is None:
+                continue  # No full name to key the row on
+            if sent is not None:
+                row[sent] = int(bool(row[sent]))
+            values.append((company, *row))
+        return columns, values
+
+    def insert_new(self, company: str, df: pd.DataFrame) -> int:
+        """Insert recruiters that aren't stored yet; returns how many were added"""
+        if df.empty:
+            return 0
+        columns, values = self._rows(company, df)
+        with self._connection() as conn:
+            before = self._count(conn, company)
+            conn.executemany(
+                f"INSERT OR IGNORE INTO recruiters ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})", values
+            )
+            return self._count(conn, company) - before
+
+    def upsert(self, company: str, df: pd.DataFrame):
+        """Insert or update rows by full name, touching only the columns present in df"""
+        if df.empty:
+            return
+        columns, values = self._rows(company, df)
+        updates = ', '.join(f"{column} = excluded.{column}" for column in columns
+                            if column not in ('company', 'full_name'))
+        conflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        with self._connection() as conn:
+            conn.executemany(
+                f"INSERT INTO recruiters ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT (company, full_name) {conflict}", values
+            )
+
+    def update(self, company: str, df: pd.DataFrame) -> int:
+        """Update the columns present in df for recruiters already stored; returns how many rows changed
+
+        Unlike upsert, names that are not stored (any more) are skipped rather than inserted.
+        """
+        if df.empty:
+            return 0
+        columns, values = self._rows(company, df)
+        assignments = ', '.join(f"{column} = ?" for column in columns[2:])
+        if not assignments:
+            return 0
+        with self._connection() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                f"UPDATE recruiters SET {assignments} WHERE company = ? AND full_name = ?",
+                [(*row[2:], row[0], row[1]) for row in values]
+            )
+            return conn.total_changes - before
+
+    def replace(self, company: str, df: pd.DataFrame):
+        """Make df the company's full recruiter list"""
+        columns, values = self._rows(company, df)
+        with self._connection() as conn:
+            conn.execute("DELETE FROM recruiters WHERE company = ?", (company,))
+            conn.executemany(
+                f"INSERT INTO recruiters ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                values
+            )
+
+    def delete(self, company: str, full_names: Iterable[str]):
+        with self._connection() as conn:
+            conn.executemany("DELETE FROM recruiters WHERE company = ? AND full_name = ?",
+                             [(company, name) for name in full_names])
+
+    def mark_sent(self, company: str, sends: Dict[Tuple[str, str], str]) -> int:
+        """Flag (full name, email) -> send time pairs as sent; returns how many rows changed"""
+        if not sends:
+            return 0
+        with self._connection() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "UPDATE recruiters SET email_sent = 1, email_sent_date = ? "
+                "WHERE company = ? AND full_name = ? AND email = ? AND email_sent = 0",
+                [(sent_at, company, name, email) for (name, email), sent_at in sends.items()]
+            )
+            return conn.total_changes - before
+
+    def export(self, company: str, path: str = None) -> str:
+        """Write a company's recruiters to an Excel workbook in the usual layout
+
+        A Parquet mirror with categorical columns is written next to it, after
+        the workbook so that it counts as the newer copy for read_workbook().
+        """
+        df = self.load(company)
+        for column in STAGE_COLUMNS:
+            unused = not df[column].any() if column == 'Email_Sent' else df[column].isna().all()
+            if unused:
+                df = df.drop(columns=column)
+
+        path = path or self.legacy_path(company)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        df.to_excel(path, index=False)
+        if pyarrow is not None:
+            compact_dtypes(df).to_parquet(columnar_path(path), index=False)
+        return path
+
+
+# Shared store, opened lazily on each call
+recruiter_store = RecruiterStore(RECRUITER_DB)
@@ -0,0 +1,88 @@
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class ScrapeCheckpoint:
+    """Per-company progress of a scrape, written after every completed page
+
+    The checkpoint file records, per role, the last page up to which every
+    page was merged and whether the role finished, plus every recruiter
+    gathered so far. A rerun after a crash loads it and continues at the next
+    page, so a page that failed is fetched again.
+    """
+
+    def __init__(self, company: str, root: str = "data/checkpoints"):
+        self.company = company
+        slug = re.sub(r'[^a-z0-9]+', '_', company.lower()).strip('_')
+        self.path = os.path.join(root, f"{slug}.json")
+        self.roles = {}
+        self.recruiters = []
+
+    def load(self) -> bool:
+        """Read a previous run's checkpoint, False when there is none"""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+            self.roles = state.get('roles', {})
+            self.recruiters = state.get('recruiters', [])
+            return True
+        except Exception as e:
+            print(f"Could not read checkpoint {self.path}, starting over: {e}")
+            return False
+
+    def next_page(self, role: str) -> Optional[int]:
+        """Page to start the role at, None if the role already finished"""
+        progress = self.roles.get(role, {})
+        if progress.get('complete'):
+            return None
+        return progress.get('last_page', 0) + 1
+
+    def page_done(self, role: str, page_num: int, recruiters: Dict[str, Dict]):
+        """Record a merged page together with the recruiters gathered so far
+
+        last_page only moves on when page_num directly follows it, never past
+        a page that failed.
+        """
+        progress = self.roles.setdefault(role, {'last_page': 0, 'complete': False})
+        if page_num == progress['last_page'] + 1:
+            progress['last_page'] = page_num
+        self._save(list(recruiters.values()))
+
+    def role_done(self, role: str, recruiters: Dict[str, Dict], last_page: int) -> bool:
+        """Mark the role finished if every page up to last_page was merged"""
+        progress = self.roles.setdefault(role, {'last_page': 0, 'complete': False})
+        progress['complete'] = progress['last_page'] >= last_page
+        if not progress['complete']:
+            print(f"{role}: page {progress['last_page'] + 1} of {last_page} is missing, "
+                  f"a rerun resumes there")
+        self._save(list(recruiters.values()))
+        return progress['complete']
+
+    def finished(self, roles: List[str]) -> bool:
+        """True once every one of the roles is done"""
+        return all(self.roles.get(role, {}).get('complete') for role in roles)
+
+    def clear(self):
+        """Remove the checkpoint once the results are saved"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _save(self, recruiters: List[Dict]):
+        self.recruiters = recruiters
+        state = {
+            'company': self.company,
+            'updated_at': datetime.now().isoformat(),
+            'roles': self.roles,
+            'recruiters': recruiters
+        }
+        # Write to a temp file and swap it in so a crash never leaves half a checkpoint
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,76 @@
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, Tuple
+
+
+class JsonlJournal:
+    """Append-only JSON lines file, fsync'd on every append"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._line_start_checked = False
+        self._lock = threading.Lock()  # Appends may come from worker threads
+
+    def _needs_newline(self) -> bool:
+        """True if a crash left the journal ending mid-line"""
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return False
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def append(self, entry: dict):
+        """Durably add one entry"""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            if not self._line_start_checked:
+                if self._needs_newline():
+                    line = "\n" + line
+                self._line_start_checked = True
+
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def entries(self) -> Iterator[dict]:
+        """Every complete entry, oldest first"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash mid-append
+                    continue
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._line_start_checked = False
+
+
+class SendJournal(JsonlJournal):
+    """Append-only log of sent emails, one JSON line per send
+
+    Each send costs one small fsync'd append instead of a table write.
+    The recruiter store is brought up to date from sent() when a run ends,
+    and again at the start of the next run in case the last one was killed
+    before it could.
+    """
+
+    def record(self, full_name: str, email: str, sent_at: datetime = None):
+        """Durably log one successful send"""
+        self.append({
+            'full_name': full_name,
+            'email': email,
+            'sent_at': (sent_at or datetime.now()).isoformat()
+        })
+
+    def sent(self) -> Dict[Tuple[str, str], str]:
+        """Map of (full name, email) to send time for every journaled send"""
+        return {(entry['full_name'], entry['email']): entry['sent_at'] for entry in self.entries()}
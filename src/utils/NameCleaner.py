@@ -1,11 +1,37 @@
 import re
+import unicodedata
+from functools import lru_cache
+import pandas as pd
+
+# Suffixes LinkedIn members add to their display name
+STATUS_SUFFIXES = ('is hiring', 'is looking', 'is seeking', 'is recruiting', 'is actively hiring',
+                   'is actively', 'is open', 'open to work', 'is open to work')
+
+# Emoji, pictographs, dingbats, arrows and geometric shapes, replaced by a space
+DECORATIONS = re.compile(
+    '[\u2190-\u21ff\u2300-\u23ff\u25a0-\u27bf\u2900-\u297f\u2b00-\u2bff\u3030\u303d'
+    '\U0001f000-\U0001faff]'
+)
+# Trademark, numbered-list and Roman numeral symbols that NFKC would turn into
+# letters and digits ("™" -> "TM", "②" -> "2"), replaced by a space before
+# normalizing. Letters in the letterlike block (ℯ, ℋ) and circled letters are
+# kept, since styled names are spelled with them.
+SYMBOLS = re.compile(
+    '[\u00a9\u00ae\u00b2\u00b3\u00b9'
+    + ''.join(re.escape(chr(c)) for c in range(0x2100, 0x2150) if not unicodedata.category(chr(c)).startswith('L'))
+    + '\u2150-\u218f\u2460-\u24b5\u24ea-\u24ff]'
+)
+# Zero-width characters, variation selectors and tags that glue emoji sequences together
+JOINERS = re.compile('[\u200b-\u200d\u2060\u20e3\ufe00-\ufe0f\U000e0020-\U000e007f]')
+
+# Distinct raw names remembered by clean_name
+NAME_CACHE_SIZE = 65536
 
 
 class NameCleaner:
     # Compile patterns on class initialization
     PATTERNS = {
-        'status': re.compile(
-            r'\s+(?:is hiring|is looking|is seeking|is recruiting|is actively hiring|is actively|is open|open to work|is open to work)$'),
+        'status': re.compile(r'\s+(?:' + '|'.join(map(re.escape, STATUS_SUFFIXES)) + r')$'),
         'credentials': re.compile(
             r',.*$|(?:\s+(?:PHD|PhD|MS|MBA|CPA|PMP|MSHR|AIRS-CDR|CPLP|CLC|CPTD|[A-Z]{2,}(?:\-[A-Z]+)?))(?:\s|$)'),
         'pronouns': re.compile(r'\s*\([^)]*\)'),
@@ -13,52 +39,58 @@ class NameCleaner:
         'special_chars': re.compile(r'[!@#$%^&*+=<>?/:;"|\\{}\[\]~`]')
     }
 
+    TITLE_PATTERNS = {
+        # Remove repetitive "3rd+"
+        'degree': (re.compile(r'(\b3rd\+\s*)+'), '3rd+ '),
+        # Remove common unnecessary suffixes
+        'suffixes': (re.compile(r'\b(career mentor|at work|looking|hiring|open|actively)\b.*$', re.IGNORECASE), '')
+    }
+
+    # Same characters as PATTERNS['special_chars'], removed with str.translate
+    SPECIAL_CHARS_TABLE = str.maketrans('', '', '!@#$%^&*+=<>?/:;"|\\{}[]~`')
+
+    NAME_COLUMNS = ['full_name', 'first_name', 'middle_name', 'last_name']
+
     # Invalid names
     INVALID_NAMES = {'all things talent', 'talent acquisition', 'recruiter',
                      'recruiting', 'hr', 'human resources', 'talent', 'creator'}
 
+    @staticmethod
+    def strip_decorations(name: str) -> str:
+        """Fold styled Unicode letters to plain ones and drop emoji and symbols"""
+        return DECORATIONS.sub(' ', JOINERS.sub('', unicodedata.normalize('NFKC', SYMBOLS.sub(' ', name))))
+
     @staticmethod
     def clean_name(name: str) -> dict:
         """
         Clean name and split into components.
         Returns None if invalid, otherwise returns dict with name components
         """
-        if not isinstance(name, str) or not name.strip():
+        if not isinstance(name, str):
             return None
 
-        # Initial cleaning
-        cleaned = name.strip()
-
-        # Apply each cleaning pattern
-        for pattern in NameCleaner.PATTERNS.values():
-            cleaned = pattern.sub('', cleaned)
-
-        # Clean up spaces
-        cleaned = ' '.join(part for part in cleaned.split() if part)
-
-        # Validate
-        if not cleaned or cleaned.lower() in NameCleaner.INVALID_NAMES:
+        parts = _normalize_name(name)
+        if parts is None:
             return None
 
-        # Split name parts
-        parts = cleaned.split()
+        full_name = ' '.join(parts)
         if len(parts) == 1:
             return {
-                'full_name': cleaned,
+                'full_name': full_name,
                 'first_name': parts[0],
                 'middle_name': '',
                 'last_name': ''
             }
         elif len(parts) == 2:
             return {
-                'full_name': cleaned,
+                'full_name': full_name,
                 'first_name': parts[0],
                 'middle_name': '',
                 'last_name': parts[1]
             }
         else:
             return {
-                'full_name': cleaned,
+                'full_name': full_name,
                 'first_name': parts[0],
                 'middle_name': parts[1],
                 'last_name': ' '.join(parts[2:])
@@ -71,8 +103,85 @@ class NameCleaner:
             return ""
 
         title = title.strip()
-        # Remove repetitive "3rd+"
-        title = re.sub(r'(\b3rd\+\s*)+', '3rd+ ', title)
-        # Remove common unnecessary suffixes
-        title = re.sub(r'\b(career mentor|at work|looking|hiring|open|actively)\b.*$', '', title, flags=re.IGNORECASE)
-        return title.strip()
\ No newline at end of file
+        for pattern, replacement in NameCleaner.TITLE_PATTERNS.values():
+            title = pattern.sub(replacement, title)
+        return title.strip()
+
+    @staticmethod
+    def clean_names(names) -> pd.DataFrame:
+        """Batch version of clean_name over a list or Series of names
+
+        Returns a DataFrame aligned with the input, with one column per name
+        component. Rows for invalid names are all None. Each distinct name is
+        cleaned once, with the patterns applied as vectorized string ops.
+        """
+        values = pd.Series(list(names) if not isinstance(names, pd.Series) else names.tolist(), dtype=object)
+        codes, uniques = pd.factorize(values)
+        uniques = pd.Series(uniques, dtype=object)
+
+        is_text = uniques.map(lambda value: isinstance(value, str))
+        cleaned = uniques.where(is_text, '').str.replace(SYMBOLS, ' ', regex=True).str.normalize('NFKC').str.replace(JOINERS, '', regex=True)
+        cleaned = cleaned.str.replace(DECORATIONS, ' ', regex=True).str.strip()
+        for name, pattern in NameCleaner.PATTERNS.items():
+            if name != 'special_chars':
+                cleaned = cleaned.str.replace(pattern, '', regex=True)
+        cleaned = cleaned.str.translate(NameCleaner.SPECIAL_CHARS_TABLE)
+
+        # Clean up spaces and split name parts column-wise
+        parts = cleaned.str.split()
+        cleaned = parts.str.join(' ')
+        valid = is_text & (cleaned != '') & ~cleaned.str.lower().isin(NameCleaner.INVALID_NAMES)
+
+        count = parts.str.len()
+        components = pd.DataFrame({
+            'full_name': cleaned,
+            'first_name': parts.str[0],
+            'middle_name': parts.str[1].where(count >= 3, ''),
+            'last_name': parts.str[1].where(count == 2, parts.str[2:].str.join(' '))
+        }, dtype=object)
+        components = components.where(valid, None)
+
+        # Missing names factorize to -1, which picks the trailing all-None row
+        components.loc[len(components)] = [None] * len(NameCleaner.NAME_COLUMNS)
+        result = components.iloc[codes].reset_index(drop=True)
+        if isinstance(names, pd.Series):
+            result.index = names.index
+        return result
+
+    @staticmethod
+    def clean_titles(titles) -> pd.Series:
+        """Batch version of clean_title over a list or Series of titles"""
+        values = pd.Series(list(titles) if not isinstance(titles, pd.Series) else titles.tolist(), dtype=object)
+        is_text = values.map(lambda value: isinstance(value, str))
+
+        cleaned = values.where(is_text, '').str.strip()
+        for pattern, replacement in NameCleaner.TITLE_PATTERNS.values():
+            cleaned = cleaned.str.replace(pattern, replacement, regex=True)
+        cleaned = cleaned.str.strip()
+
+        if isinstance(titles, pd.Series):
+            cleaned.index = titles.index
+        return cleaned
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _normalize_name(name: str):
+    """Cleaned name parts for a raw display name, None if it isn't a usable name
+
+    Applies the PATTERNS in their original order (they overlap, so the order
+    matters) as up to three re.sub calls, skipping the status and pronoun
+    patterns when a cheap check shows they cannot match. Special characters
+    are removed with a translate table and the name is split once at the end.
+    """
+    cleaned = NameCleaner.strip_decorations(name).strip()
+
+    if cleaned.endswith(STATUS_SUFFIXES):
+        cleaned = NameCleaner.PATTERNS['status'].sub('', cleaned)
+    cleaned = NameCleaner.PATTERNS['credentials'].sub('', cleaned)
+    if '(' in cleaned:
+        cleaned = NameCleaner.PATTERNS['pronouns'].sub('', cleaned)
+    parts = tuple(cleaned.translate(NameCleaner.SPECIAL_CHARS_TABLE).split())
+
+    if not parts or ' '.join(parts).lower() in NameCleaner.INVALID_NAMES:
+        return None
+    return parts
@@ -6,8 +6,20 @@ from dotenv import load_dotenv
 
 from .apollo_client import ApolloClient
 from .NameCleaner import NameCleaner
+from .stepTimer import StepTimer, step_timer
+from .adaptivePacer import AdaptivePacer, ChallengeError, pacer
+from .recruiterDedup import RecruiterDedupIndex, dedupe_recruiters
+from .rateLimiter import TokenBucketLimiter
 
 __all__ = [
     'ApolloClient',
-    'NameCleaner'
+    'NameCleaner',
+    'StepTimer',
+    'step_timer',
+    'AdaptivePacer',
+    'ChallengeError',
+    'pacer',
+    'RecruiterDedupIndex',
+    'dedupe_recruiters',
+    'TokenBucketLimiter'
 ]
\ No newline at end of file
@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from src.config import PACER_MIN_DELAY, PACER_MAX_DELAY, CHALLENGE_COOLDOWN
+
+DEFAULT_TIMEOUT = 10.0  # Seconds, used until enough latencies have been observed
+MIN_SAMPLES = 5
+
+
+class AdaptivePacer:
+    """Pace LinkedIn navigation from observed page latencies and challenge pages
+
+    Each navigation's latency is observed. Slow responses, timeouts and
+    checkpoint/CAPTCHA pages back the delay off and widen timeouts, while
+    normal responses let the delay decay back towards min_delay. Timeouts
+    follow the recent 95th percentile latency.
+    """
+
+    def __init__(self, min_delay: float = 0.0, max_delay: float = 30.0, min_timeout: float = 5.0,
+                 max_timeout: float = 60.0, challenge_cooldown: float = 120.0, window: int = 50):
+        self._lock = threading.Lock()
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.challenge_cooldown = challenge_cooldown
+        self.latencies = deque(maxlen=window)
+        self.delay = min_delay
+        self.timeout_scale = 1.0
+        self.timeouts = 0
+        self.challenges = 0
+
+    def percentile(self, q: float):
+        """q-th percentile of recent latencies in seconds, None without samples"""
+        with self._lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(round(q / 100 * (len(samples) - 1))))]
+
+    def timeout_ms(self) -> int:
+        """Timeout for the next wait, in milliseconds as Playwright expects"""
+        p95 = self.percentile(95) if len(self.latencies) >= MIN_SAMPLES else None
+        seconds = (p95 * 4 if p95 is not None else DEFAULT_TIMEOUT) * self.timeout_scale
+        return int(min(self.max_timeout, max(self.min_timeout, seconds)) * 1000)
+
+    def observe(self, seconds: float):
+        """Record a navigation latency and adjust the delay"""
+        median = self.percentile(50)
+        slow = (median is not None and len(self.latencies) >= MIN_SAMPLES and seconds > 3 * median) \
+            or seconds > self.timeout_ms() / 2000
+        with self._lock:
+            self.latencies.append(seconds)
+            if slow:
+                self.delay = min(self.max_delay, max(self.delay * 1.5, 0.5))
+            else:
+                self.delay = max(self.min_delay, self.delay * 0.8)
+                if self.delay < 0.05:
+                    self.delay = self.min_delay
+                self.timeout_scale = max(1.0, self.timeout_scale * 0.95)
+        if slow:
+            self.log(f"slow response ({seconds:.1f}s)")
+
+    def record_timeout(self):
+        """A wait ran out: back off and give the next waits more room"""
+        with self._lock:
+            self.timeouts += 1
+            self.delay = min(self.max_delay, max(self.delay * 2, 1.0))
+            self.timeout_scale = min(4.0, self.timeout_scale * 1.5)
+        self.log("timeout")
+
+    def record_challenge(self):
+        """LinkedIn showed a checkpoint or CAPTCHA page: back off hard"""
+        with self._lock:
+            self.challenges += 1
+            self.delay = min(self.max_delay, max(self.delay * 4, 10.0))
+            self.timeout_scale = min(4.0, self.timeout_scale * 2)
+        self.log("challenge page")
+
+    @contextmanager
+    def measure(self):
+        """Observe the wrapped navigation, counting Playwright timeouts as such"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            if 'Timeout' in type(e).__name__:
+                self.record_timeout()
+            raise
+        self.observe(time.perf_counter() - start)
+
+    def pause(self, minimum: float = 0.0):
+        """Wait the current delay before the next navigation"""
+        seconds = max(self.delay, minimum)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def describe(self) -> str:
+        p50, p90 = self.percentile(50), self.percentile(90)
+        latency = f"p50 {p50:.1f}s, p90 {p90:.1f}s" if p50 is not None else "no samples"
+        return (f"delay {self.delay:.1f}s, timeout {self.timeout_ms() / 1000:.0f}s, {latency}, "
+                f"{self.timeouts} timeouts, {self.challenges} challenges")
+
+    def log(self, reason: str):
+        print(f"Pacer ({reason}): {self.describe()}")
+
+
+class ChallengeError(Exception):
+    """LinkedIn is showing a checkpoint or CAPTCHA page that did not clear"""
+
+
+# Shared pacer for every LinkedIn page in the process
+pacer = AdaptivePacer(PACER_MIN_DELAY, PACER_MAX_DELAY, challenge_cooldown=CHALLENGE_COOLDOWN)
@@ -1,15 +1,25 @@
 import os
+import threading
 import requests
 import json
 from dotenv import load_dotenv
-from datetime import datetime
+from src.config import APOLLO_MINUTE_LIMIT, APOLLO_HOURLY_LIMIT, APOLLO_DAILY_LIMIT, APOLLO_MAX_WAIT
+from src.utils.rateLimiter import TokenBucketLimiter
 
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Request budgets of the Apollo plan, shared by every client in the process
+apollo_limiter = TokenBucketLimiter({
+    'minute': (APOLLO_MINUTE_LIMIT, 60),
+    'hour': (APOLLO_HOURLY_LIMIT, 3600),
+    'day': (APOLLO_DAILY_LIMIT, 86400)
+})
+
+
 class ApolloClient:
-    def __init__(self):
+    def __init__(self, limiter: TokenBucketLimiter = None, max_wait: float = APOLLO_MAX_WAIT):
         self.api_key = os.getenv("APOLLO_API_KEY")
         if not self.api_key:
             raise ValueError("APOLLO_API_KEY not found in .env file")
@@ -20,9 +30,8 @@ class ApolloClient:
             "Content-Type": "application/json",
             "x-api-key": self.api_key
         }
-        self.daily_limit = 600
-        self.hourly_limit = 200
-        self.minute_limit = 50
+        self.limiter = limiter or apollo_limiter
+        self.max_wait = max_wait
 
         self._reset_usage_counters()
 
@@ -31,50 +40,27 @@ class ApolloClient:
         self.daily_usage = 0
         self.hourly_usage = 0
         self.minute_usage = 0
-        self.last_reset_day = datetime.now()
-        self.last_reset_hour = datetime.now()
-        self.last_reset_minute = datetime.now()
 
     def _update_usage(self, response_headers):
-        """Update usage from API response headers"""
+        """Update usage from API response headers and let the limiter catch up"""
         self.daily_usage = int(response_headers.get('x-24-hour-usage', 0))
         self.hourly_usage = int(response_headers.get('x-hourly-usage', 0))
         self.minute_usage = int(response_headers.get('x-minute-usage', 0))
+        self.limiter.observe_usage({'day': self.daily_usage, 'hour': self.hourly_usage,
+                                    'minute': self.minute_usage})
 
-    def _check_rate_limits(self) -> tuple[bool, str]:
-        """Check if we've hit any rate limits"""
-        now = datetime.now()
-
-        # Reset counters if time windows have passed
-        if (now - self.last_reset_day).days >= 1:
-            self.daily_usage = 0
-            self.last_reset_day = now
-        if (now - self.last_reset_hour).seconds >= 3600:
-            self.hourly_usage = 0
-            self.last_reset_hour = now
-        if (now - self.last_reset_minute).seconds >= 60:
-            self.minute_usage = 0
-            self.last_reset_minute = now
-
-        # Check limits
-        if self.daily_usage >= self.daily_limit:
-            return False, "Daily limit reached"
-        if self.hourly_usage >= self.hourly_limit:
-            return False, "Hourly limit reached"
-        if self.minute_usage >= self.minute_limit:
-            return False, "Minute limit reached"
-
-        return True, ""
-
-    def fetch_apollo_data(self, first_name: str, last_name: str, organization_name: str, domain: str) -> dict:
+    def fetch_apollo_data(self, first_name: str, last_name: str, organization_name: str, domain: str,
+                          stop: threading.Event = None) -> dict:
         """
         Fetch person data from Apollo API using name, company, and domain.
+        Waits for the rate limiter, up to max_wait seconds or until stop is set.
         Returns the API response as a dictionary or an error dict if failed.
         """
         try:
-            can_make_request, limit_message = self._check_rate_limits()
-            if not can_make_request:
-                return {"error": limit_message}
+            if not self.limiter.acquire(self.max_wait, stop):
+                if stop is not None and stop.is_set():
+                    return {"error": "Stopped before the next request slot"}
+                return {"error": f"Rate limit reached, next request slot in {self.limiter.wait_time():.0f}s"}
             params = {
                 "first_name": first_name,
                 "last_name": last_name,
@@ -93,6 +79,7 @@ class ApolloClient:
                 self._update_usage(response.headers)
 
             if response.status_code == 429:
+                self.limiter.throttle('minute')
                 return {"error": "Rate limit exceeded"}
 
             response.raise_for_status()
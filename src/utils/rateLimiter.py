@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Dict, Tuple
+
+# Longest single sleep in acquire, so a stop request is noticed promptly
+SLEEP_SLICE = 1.0
+
+
+class TokenBucketLimiter:
+    """Token buckets for several request budgets at once, shared between threads
+
+    Each budget is a bucket of `limit` tokens refilled evenly over its period,
+    e.g. {'minute': (50, 60), 'hour': (200, 3600)}. A request takes one token
+    from every bucket, so it waits for the tightest budget instead of failing.
+    Usage reported by the API can only lower the tokens left, keeping the
+    buckets honest across runs and other clients on the same key.
+    """
+
+    def __init__(self, budgets: Dict[str, Tuple[int, float]], clock=time.monotonic, sleep=time.sleep):
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self.budgets = dict(budgets)
+        self.tokens = {name: float(limit) for name, (limit, _) in self.budgets.items()}
+        self.updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        elapsed = now - self.updated
+        self.updated = now
+        for name, (limit, period) in self.budgets.items():
+            self.tokens[name] = min(limit, self.tokens[name] + elapsed * limit / period)
+
+    def _wait_time(self) -> float:
+        """Seconds until every bucket holds a whole token"""
+        return max(max(0.0, 1 - self.tokens[name]) * period / limit
+                   for name, (limit, period) in self.budgets.items())
+
+    def wait_time(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._wait_time()
+
+    def acquire(self, max_wait: float = None, stop: threading.Event = None) -> bool:
+        """Take a token from every bucket, waiting for one if needed
+
+        Returns False without waiting if the next token is further away than
+        max_wait seconds, or as soon as stop is set while waiting.
+        """
+        while True:
+            if stop is not None and stop.is_set():
+                return False
+            with self._lock:
+                self._refill()
+                wait = self._wait_time()
+                if wait <= 0:
+                    for name in self.tokens:
+                        self.tokens[name] -= 1
+                    return True
+            if max_wait is not None and wait > max_wait:
+                return False
+            self._sleep(min(wait, SLEEP_SLICE))
+
+    def observe_usage(self, used: Dict[str, int]):
+        """Lower the buckets to what the API says is left of each budget"""
+        with self._lock:
+            self._refill()
+            for name, count in used.items():
+                if name in self.budgets:
+                    self.tokens[name] = min(self.tokens[name], self.budgets[name][0] - count)
+
+    def throttle(self, name: str = None):
+        """The API refused a request: empty one bucket, or all of them"""
+        with self._lock:
+            self._refill()
+            for bucket in ([name] if name else self.tokens):
+                self.tokens[bucket] = min(self.tokens[bucket], 0.0)
@@ -0,0 +1,224 @@
+import difflib
+import re
+import unicodedata
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional
+import pandas as pd
+
+SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'), **dict.fromkeys('dt', '3'),
+    'l': '4', **dict.fromkeys('mn', '5'), 'r': '6'
+}
+
+# Copied from a dropped duplicate when the kept row has them blank
+FILL_COLUMNS = ['Title', 'LinkedIn URL', 'Headline', 'Email_Draft']
+EMAIL_COLUMNS = ['Email', 'Email Status', 'Email Source']
+# Send state; the duplicate that was emailed is the one kept
+SENT_COLUMNS = ['Email_Sent', 'Email_Sent_Date']
+MERGE_COLUMNS = FILL_COLUMNS + EMAIL_COLUMNS + SENT_COLUMNS
+
+
+@lru_cache(maxsize=65536)
+def fold(text: str) -> str:
+    """Lowercase, strip accents and punctuation: 'Jáne-Marie' -> 'janemarie'"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    return re.sub(r'[\W_]+', '', stripped)
+
+
+@lru_cache(maxsize=65536)
+def soundex(word: str) -> str:
+    """American Soundex code of a folded word; non-Latin words are their own code"""
+    if not word or not word.isascii():
+        return word
+    code = word[0].upper()
+    previous = SOUNDEX_CODES.get(word[0], '')
+    for char in word[1:]:
+        digit = SOUNDEX_CODES.get(char, '')
+        if digit and digit != previous:
+            code += digit
+        if char not in 'hw':
+            previous = digit
+    return (code + '000')[:4]
+
+
+def normalize_url(url) -> str:
+    """Canonical form of a LinkedIn profile URL, '' for anything else"""
+    if not isinstance(url, str) or '/in/' not in url:
+        return ''
+    path = url.split('?')[0].split('#')[0].rstrip('/').lower()
+    return path[path.index('/in/'):]
+
+
+def _text(value) -> str:
+    return value if isinstance(value, str) else ''
+
+
+def _flag(value) -> bool:
+    try:
+        return not pd.isna(value) and bool(value)
+    except (TypeError, ValueError):
+        return False
+
+
+class RecruiterDedupIndex:
+    """Index of recruiters that finds near-duplicates by blocking key
+
+    Each recruiter is filed under its LinkedIn URL and under its folded last
+    name with the Soundex code of its first name, so a lookup only compares
+    against the few records sharing a bucket. Within a bucket, two records are
+    the same person when their profile URLs agree, or, without conflicting
+    URLs, when the folded last names match, the first names match or are
+    nearly identical, and the middle names don't contradict each other (an
+    initial only has to match the other middle name's first letter).
+    """
+
+    FIRST_NAME_SIMILARITY = 0.85
+
+    def __init__(self):
+        self.records = []
+        self.buckets = defaultdict(list)
+
+    @staticmethod
+    def _key_fields(first, middle, last, url) -> tuple:
+        return fold(_text(first)), fold(_text(middle)), fold(_text(last)), normalize_url(url)
+
+    @staticmethod
+    def _blocking_keys(fields: tuple) -> list:
+        first, _, last, url = fields
+        keys = [('name', last, soundex(first))]
+        if url:
+            keys.append(('url', url))
+        return keys
+
+    def _same_person(self, a: tuple, b: tuple) -> bool:
+        a_first, a_middle, a_last, a_url = a
+        b_first, b_middle, b_last, b_url = b
+        if a_url and b_url:
+            return a_url == b_url
+        if not a_last or a_last != b_last:
+            return False
+        if a_middle and b_middle:
+            if len(a_middle) == 1 or len(b_middle) == 1:
+                if a_middle[0] != b_middle[0]:
+                    return False
+            elif a_middle != b_middle:
+                return False
+        if a_first == b_first:
+            return True
+        return (a_first[:1] == b_first[:1] and
+                difflib.SequenceMatcher(None, a_first, b_first).ratio() >= self.FIRST_NAME_SIMILARITY)
+
+    def _find(self, fields: tuple, keys: list) -> Optional[int]:
+        for key in keys:
+            for position in self.buckets.get(key, ()):
+                if self._same_person(fields, self.records[position]):
+                    return position
+        return None
+
+    def find(self, first, middle='', last='', url='') -> Optional[int]:
+        """Position of an indexed record that is the same person, None if there is none"""
+        fields = self._key_fields(first, middle, last, url)
+        return self._find(fields, self._blocking_keys(fields))
+
+    def add(self, first, middle='', last='', url='') -> Optional[int]:
+        """Index a record unless it duplicates one; returns the duplicate's position or None"""
+        fields = self._key_fields(first, middle, last, url)
+        keys = self._blocking_keys(fields)
+        duplicate = self._find(fields, keys)
+        if duplicate is not None:
+            return duplicate
+
+        self.records.append(fields)
+        for key in keys:
+            self.buckets[key].append(len(self.records) - 1)
+        return None
+
+
+KEY_COLUMNS = ['First Name', 'Middle Name', 'Last Name', 'LinkedIn URL']
+
+
+def _columns(df: pd.DataFrame, columns: list) -> dict:
+    return {column: df[column].tolist() if column in df.columns else [None] * len(df) for column in columns}
+
+
+def _rank(values: dict, position: int) -> tuple:
+    """Which of two duplicates to keep: the one already emailed, then the one with an email"""
+    sent = 'Email_Sent' in values and _flag(values['Email_Sent'][position])
+    has_email = 'Email' in values and bool(_text(values['Email'][position]))
+    return sent, has_email
+
+
+def _fill(values: dict, target: int, source: int) -> bool:
+    """Fill the kept row's blanks from a dropped duplicate; True if anything changed"""
+    changed = False
+    for column in FILL_COLUMNS:
+        if column in values and not _text(values[column][target]) and _text(values[column][source]):
+            values[column][target] = values[column][source]
+            changed = True
+    if 'Email' in values and not _text(values['Email'][target]) and _text(values['Email'][source]):
+        for column in EMAIL_COLUMNS:
+            if column in values:
+                values[column][target] = values[column][source]
+        changed = True
+    return changed
+
+
+def dedupe_recruiters(df: pd.DataFrame, existing: pd.DataFrame = None) -> pd.DataFrame:
+    """Drop near-duplicate recruiter rows, keeping one row per person
+
+    The kept row is the first one, unless a later duplicate was already
+    emailed or has an email and the first doesn't, so send state is never
+    dropped. Blank titles, URLs, headlines, drafts and emails of the kept row
+    are filled in from its duplicates. With existing, rows matching anyone
+    already stored are dropped as well.
+    """
+    index = RecruiterDedupIndex()
+    if existing is not None:
+        for fields in zip(*_columns(existing, KEY_COLUMNS).values()):
+            index.add(*fields)
+    stored = len(index.records)
+
+    values = _columns(df, [column for column in MERGE_COLUMNS if column in df.columns])
+    kept = {}  # index position -> row position in df
+    drop = set()
+    filled = set()
+    for position, fields in enumerate(zip(*_columns(df, KEY_COLUMNS).values())):
+        duplicate = index.add(*fields)
+        if duplicate is None:
+            kept[len(index.records) - 1] = position
+            continue
+
+        if duplicate < stored:
+            drop.add(position)
+            continue
+
+        # Keep whichever row carries the send state, and fill its blanks from the other
+        target = kept[duplicate]
+        if _rank(values, position) > _rank(values, target):
+            kept[duplicate] = position
+            target, position = position, target
+        drop.add(position)
+        if _fill(values, target, position):
+            filled.add(target)
+
+    if not drop:
+        return df
+
+    print(f"Dropped {len(drop)} duplicate recruiters")
+    df = df.copy()
+    for position in filled - drop:
+        for column in values:
+            df.at[df.index[position], column] = values[column][position]
+    return df.drop(index=df.index[sorted(drop)])
+
+
+def changed_columns(df: pd.DataFrame, deduped: pd.DataFrame) -> Dict[object, List[str]]:
+    """Columns dedupe_recruiters filled in, per kept row index label"""
+    columns = [column for column in MERGE_COLUMNS if column in deduped.columns]
+    before = df.loc[deduped.index, columns]
+    after = deduped[columns]
+    diff = (before != after) & ~(before.isna() & after.isna())
+    diff = diff[diff.any(axis=1)]
+    return {label: [column for column in columns if row[column]] for label, row in diff.iterrows()}
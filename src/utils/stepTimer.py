@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class StepTimer:
+    """Collect wall-clock latencies of named scraping steps for a run"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.timings = defaultdict(list)
+
+    def reset(self):
+        """Start a new run"""
+        with self._lock:
+            self.timings = defaultdict(list)
+
+    @contextmanager
+    def step(self, name: str):
+        """Time the wrapped block and record it under name, even if it raises"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            self.timings[name].append(seconds)
+
+    def report(self) -> dict:
+        """Summarise each step as count, total, mean and max seconds"""
+        with self._lock:
+            return {
+                name: {
+                    'count': len(samples),
+                    'total': sum(samples),
+                    'mean': sum(samples) / len(samples),
+                    'max': max(samples)
+                }
+                for name, samples in self.timings.items() if samples
+            }
+
+    def print_report(self):
+        report = self.report()
+        if not report:
+            return
+
+        print("\nStep timing report:")
+        print(f"{'Step':<22}{'Count':>7}{'Total (s)':>12}{'Mean (s)':>11}{'Max (s)':>10}")
+        for name, stats in sorted(report.items(), key=lambda item: -item[1]['total']):
+            print(f"{name:<22}{stats['count']:>7}{stats['total']:>12.2f}"
+                  f"{stats['mean']:>11.2f}{stats['max']:>10.2f}")
+
+
+# Shared timer for the current run
+step_timer = StepTimer()
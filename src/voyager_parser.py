@@ -0,0 +1,81 @@
+import re
+from typing import List, Dict, Iterator
+from src.html_parser import SKIPPED_NAMES
+
+
+# Result payloads of the people-search page (REST and GraphQL flavours)
+SEARCH_RESULTS_URL_MARKERS = ('voyagerSearchDashClusters', '/voyager/api/search/dash/clusters')
+
+PROFILE_URN = re.compile(r'urn:li:fsd_profile:[A-Za-z0-9_-]+')
+
+
+def is_search_results_url(url: str) -> bool:
+    """True for the XHR responses that carry people-search results"""
+    return any(marker in url for marker in SEARCH_RESULTS_URL_MARKERS)
+
+
+class VoyagerProcessor:
+    """Extract recruiters from LinkedIn's search results JSON (the voyager API)
+
+    Results appear as EntityResultViewModel objects, either nested in the
+    response data or listed in its 'included' array, so the payload is walked
+    and every profile result is picked up wherever it sits.
+    """
+
+    def process_payloads(self, payloads: List[dict]) -> List[Dict[str, str]]:
+        """Extract unique recruiters from a page's search responses"""
+        recruiters = []
+        seen_names = set()
+        try:
+            for payload in payloads:
+                for result in self._entity_results(payload):
+                    recruiter = self._to_recruiter(result)
+                    if not recruiter:
+                        continue
+
+                    name = recruiter['name']
+                    if name in SKIPPED_NAMES or name in seen_names:
+                        continue
+
+                    recruiters.append(recruiter)
+                    seen_names.add(name)
+
+            print(f"Extracted {len(recruiters)} recruiters from {len(payloads)} search responses")
+
+        except Exception as e:
+            print(f"Error processing search responses: {e}")
+
+        return recruiters
+
+    def _entity_results(self, node) -> Iterator[dict]:
+        """Yield every dict that looks like a search result entity"""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                if 'entityUrn' in current and 'navigationUrl' in current and 'title' in current:
+                    yield current
+                stack.extend(reversed(list(current.values())))
+            elif isinstance(current, list):
+                stack.extend(reversed(current))
+
+    def _to_recruiter(self, result: dict):
+        """Map one EntityResultViewModel to a recruiter record, None if it isn't a profile"""
+        url = result.get('navigationUrl') or ''
+        if '/in/' not in url:
+            return None
+
+        name = ((result.get('title') or {}).get('text') or '').strip()
+        if not name:
+            return None
+
+        headline = ((result.get('primarySubtitle') or {}).get('text') or '').strip()
+        urn_match = PROFILE_URN.search(result.get('entityUrn') or '') or \
+            PROFILE_URN.search(result.get('trackingUrn') or '')
+
+        return {
+            'name': name,
+            'title': headline,
+            'linkedin_url': url.split('?')[0],
+            'profile_urn': urn_match.group(0) if urn_match else ''
+        }
@@ -0,0 +1,40 @@
+from src.utils.adaptivePacer import AdaptivePacer
+
+
+def test_timeout_follows_observed_latency():
+    pacer = AdaptivePacer(min_timeout=1.0, max_timeout=60.0)
+    assert pacer.timeout_ms() == 10000  # default until enough samples
+
+    for _ in range(10):
+        pacer.observe(1.0)
+
+    assert pacer.timeout_ms() == 4000
+    assert pacer.delay == 0.0
+
+
+def test_slow_responses_and_challenges_back_off():
+    pacer = AdaptivePacer(max_delay=30.0)
+    for _ in range(10):
+        pacer.observe(1.0)
+
+    pacer.observe(5.0)
+    slowed = pacer.delay
+    assert slowed > 0
+
+    pacer.record_challenge()
+    assert pacer.delay >= 10.0
+    assert pacer.challenges == 1
+
+    for _ in range(50):
+        pacer.observe(1.0)
+    assert pacer.delay < slowed
+
+
+def test_timeouts_widen_waits():
+    pacer = AdaptivePacer()
+    before = pacer.timeout_ms()
+
+    pacer.record_timeout()
+
+    assert pacer.timeout_ms() > before
+    assert pacer.delay >= 1.0
@@ -2,11 +2,13 @@ import pytest
 import responses
 import json
 from src.utils.apollo_client import ApolloClient
+from src.utils.rateLimiter import TokenBucketLimiter
 
 @pytest.fixture
 def apollo_client():
-    """Create Apollo client instance"""
-    return ApolloClient()
+    """Create Apollo client instance with its own rate limiter"""
+    limiter = TokenBucketLimiter({'minute': (50, 60), 'hour': (200, 3600), 'day': (600, 86400)})
+    return ApolloClient(limiter=limiter, max_wait=0)
 
 @pytest.fixture
 def sample_response():
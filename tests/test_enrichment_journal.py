@@ -0,0 +1,43 @@
+import pandas as pd
+from src.enrichmentJournal import EnrichmentJournal
+from src.recruiterStore import recruiter_store
+
+
+def test_compact_applies_latest_fields(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    recruiter_store.replace("Acme", pd.DataFrame({'Full Name': ['Jane Smith', 'Raj Patel'],
+                                                  'Title': ['Recruiter', 'Sourcer']}))
+
+    journal = EnrichmentJournal("Acme")
+    journal.record("Jane Smith", {'Email': 'j@acme.com', 'Email Status': 'guessed'})
+    journal.record("Jane Smith", {'Email': 'jane@acme.com', 'Email Status': 'verified'})
+    # A crash mid-append leaves a partial last line behind
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"Full Name": "Raj')
+
+    assert EnrichmentJournal("Acme").compact() == 1
+    assert not (tmp_path / journal.path).exists()
+
+    df = recruiter_store.load("Acme").set_index('Full Name')
+    assert df.loc['Jane Smith', 'Email'] == 'jane@acme.com'
+    assert df.loc['Jane Smith', 'Title'] == 'Recruiter'
+    assert pd.isna(df.loc['Raj Patel', 'Email'])
+
+
+def test_compact_without_journal(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert EnrichmentJournal("Acme").compact() == 0
+
+
+def test_compact_skips_recruiters_no_longer_stored(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    recruiter_store.replace("Acme", pd.DataFrame({'Full Name': ['Jane Smith'], 'Title': ['Recruiter']}))
+
+    journal = EnrichmentJournal("Acme")
+    journal.record("Jane Smith", {'Email': 'jane@acme.com'})
+    journal.record("Jane A Smith", {'Email': 'jane@acme.com'})  # Merged away since
+
+    assert journal.compact() == 1
+    df = recruiter_store.load("Acme")
+    assert df['Full Name'].tolist() == ['Jane Smith']
+    assert df['Email'].tolist() == ['jane@acme.com']
@@ -0,0 +1,146 @@
+import time
+import pytest
+import pandas as pd
+import src.excelhandler as excelhandler
+from src.excelhandler import save_recruiter_data, load_known_recruiters, get_mails_from_apollo
+from src.recruiterStore import recruiter_store
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Run against an empty working directory so data/ is temporary"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "data"
+
+
+def test_merge_keeps_stored_rows_and_appends_new(data_dir):
+    """An incremental save should not overwrite enrichment done on stored rows"""
+    assert save_recruiter_data([{'name': 'John Doe', 'title': 'Recruiter'}], "TestCompany")
+
+    recruiter_store.upsert("TestCompany", pd.DataFrame({'Full Name': ['John Doe'],
+                                                        'Email': ['john.doe@testcompany.com']}))
+
+    assert load_known_recruiters("TestCompany") == {'John Doe'}
+
+    recruiters = [{'name': 'John Doe is hiring', 'title': 'Recruiter'},
+                  {'name': 'Jane Smith', 'title': 'University Recruiter'}]
+    assert save_recruiter_data(recruiters, "TestCompany", merge=True)
+
+    df = recruiter_store.load("TestCompany")
+    assert list(df['Full Name']) == ['John Doe', 'Jane Smith']
+    assert df.loc[0, 'Email'] == 'john.doe@testcompany.com'
+    assert df.loc[0, 'Title'] == 'Recruiter'
+
+
+def test_no_known_recruiters_without_file(data_dir):
+    assert load_known_recruiters("Missing") == set()
+
+
+def test_apollo_results_survive_a_crash(data_dir, monkeypatch):
+    """Results journaled before a crash are in the store after the next run starts"""
+    recruiters = [{'name': 'Jane Smith'}, {'name': 'Raj Patel'}]
+    assert save_recruiter_data(recruiters, "TestCompany")
+
+    class CrashingClient:
+        def fetch_apollo_data(self, first_name, **kwargs):
+            if first_name == 'Raj':
+                raise KeyboardInterrupt
+            return {'person': {'email': 'jane@testcompany.com', 'email_status': 'verified'}}
+
+    monkeypatch.setattr(excelhandler, 'ApolloClient', CrashingClient)
+    with pytest.raises(KeyboardInterrupt):
+        get_mails_from_apollo("TestCompany")
+    assert recruiter_store.load("TestCompany").loc[0, 'Email'] == ''
+
+    class RateLimitedClient:
+        def fetch_apollo_data(self, **kwargs):
+            return {'error': 'rate limit exceeded'}
+
+    monkeypatch.setattr(excelhandler, 'ApolloClient', RateLimitedClient)
+    assert get_mails_from_apollo("TestCompany")
+
+    df = recruiter_store.load("TestCompany")
+    assert list(df['Email']) == ['jane@testcompany.com', '']
+    assert df.loc[0, 'Email Source'] == 'apollo'
+
+
+def test_concurrent_results_are_applied_in_order(data_dir, monkeypatch, capsys):
+    names = ['Ana Lima', 'Ben Ito', 'Cy Hart', 'Di Roe']
+    assert save_recruiter_data([{'name': name} for name in names], "TestCompany")
+
+    class SlowFirstClient:
+        def fetch_apollo_data(self, first_name, **kwargs):
+            time.sleep(0.2 if first_name == 'Ana' else 0)
+            return {'person': {'email': f'{first_name.lower()}@testcompany.com', 'email_status': 'verified'}}
+
+    monkeypatch.setattr(excelhandler, 'ApolloClient', SlowFirstClient)
+    assert get_mails_from_apollo("TestCompany", concurrency=4)
+
+    generated = [line.split(': ')[1].split(' ->')[0] for line in capsys.readouterr().out.splitlines()
+                 if line.startswith('Generated')]
+    assert generated == names
+    assert list(recruiter_store.load("TestCompany")['Email']) == [
+        'ana@testcompany.com', 'ben@testcompany.com', 'cy@testcompany.com', 'di@testcompany.com']
+
+
+def test_results_behind_a_slow_request_survive_a_crash(data_dir, monkeypatch):
+    """Responses finished while an earlier row is still in flight are journaled right away"""
+    assert save_recruiter_data([{'name': 'Ana Lima'}, {'name': 'Ben Ito'}], "TestCompany")
+
+    class CrashingHeadClient:
+        def fetch_apollo_data(self, first_name, **kwargs):
+            if first_name == 'Ana':
+                time.sleep(0.2)
+                raise KeyboardInterrupt
+            return {'person': {'email': 'ben@testcompany.com', 'email_status': 'verified'}}
+
+    monkeypatch.setattr(excelhandler, 'ApolloClient', CrashingHeadClient)
+    with pytest.raises(KeyboardInterrupt):
+        get_mails_from_apollo("TestCompany", concurrency=2)
+
+    class RateLimitedClient:
+        def fetch_apollo_data(self, **kwargs):
+            return {'error': 'rate limit exceeded'}
+
+    monkeypatch.setattr(excelhandler, 'ApolloClient', RateLimitedClient)
+    assert get_mails_from_apollo("TestCompany")
+    assert list(recruiter_store.load("TestCompany")['Email']) == ['', 'ben@testcompany.com']
+
+
+def test_merging_duplicates_keeps_send_state(data_dir, monkeypatch):
+    """A merged duplicate that was already emailed must not be emailed again"""
+    recruiter_store.replace("TestCompany", pd.DataFrame({
+        'Full Name': ['Jane Smith', 'Jane A. Smith', 'Raj Patel'],
+        'First Name': ['Jane', 'Jane', 'Raj'],
+        'Middle Name': ['', 'A.', ''],
+        'Last Name': ['Smith', 'Smith', 'Patel'],
+        'Title': ['Recruiter', '', ''],
+        'Email': ['', 'jane@testcompany.com', ''],
+        'Email Status': ['', 'verified', ''],
+        'Email Source': ['', 'apollo', ''],
+        'Email_Sent': [False, True, False],
+        'Email_Sent_Date': [None, '2024-01-02T10:00:00', None]
+    }))
+
+    class RateLimitedClient:
+        def fetch_apollo_data(self, **kwargs):
+            return {'error': 'rate limit exceeded'}
+
+    # Only the cells the merge filled in are written back, so concurrent updates survive
+    written = []
+    upsert = recruiter_store.upsert
+    monkeypatch.setattr(recruiter_store, 'upsert',
+                        lambda company, rows: written.append(rows.to_dict('records')) or upsert(company, rows))
+    monkeypatch.setattr(excelhandler, 'ApolloClient', RateLimitedClient)
+    assert get_mails_from_apollo("TestCompany")
+    assert written == [[{'Full Name': 'Jane A. Smith', 'Title': 'Recruiter'}]]
+
+    df = recruiter_store.load("TestCompany").set_index('Full Name')
+    assert list(df.index) == ['Jane A. Smith', 'Raj Patel']
+    assert df.loc['Jane A. Smith', 'Email_Sent']
+    assert df.loc['Jane A. Smith', 'Email_Sent_Date'] == '2024-01-02T10:00:00'
+    assert df.loc['Jane A. Smith', 'Title'] == 'Recruiter'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
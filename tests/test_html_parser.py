@@ -0,0 +1,80 @@
+import pytest
+from src.html_parser import HTMLProcessor, lxml
+
+
+RESULTS_PAGE = """
+<html><body>
+<div class="global-nav"><div class="presence-entity"><img alt="Krishna Sarda"></div></div>
+<ul>
+  <li><div class="entity-result__item entity-result--with-actions">
+    <div class="presence-entity presence-entity--size-3"><img alt=" John Doe " src="a.jpg"></div>
+    <a href="https://www.linkedin.com/in/johndoe?miniProfileUrn=abc">John Doe</a>
+    <div class="entity-result__primary-subtitle t-14"> Technical <!-- x --><b>Recruiter</b> &amp; Sourcer</div>
+  </div></li>
+  <li><div class="entity-result__item">
+    <div class="presence-entity"><img alt="LinkedIn Member"></div>
+  </div></li>
+  <li><div class="entity-result__item">
+    <div class="presence-entity"><img alt="Jane Smith"></div>
+    <a href="/in/janesmith">Jane Smith</a>
+    <div class="entity-result__primary-subtitle">University Recruiter<script>var x;</script></div>
+  </div></li>
+</ul>
+<div class="presence-entity"><img alt="John Doe"></div>
+</body></html>
+"""
+
+ENGINES = ['soup', 'strainer'] + (['lxml'] if lxml is not None else [])
+
+
+def test_process_html_matches_process_file(sample_html_file, sample_html_content):
+    """In-memory HTML processing should match processing the same page from disk"""
+    processor = HTMLProcessor()
+
+    from_file = processor.process_file(str(sample_html_file))
+    from_memory = processor.process_html(sample_html_content)
+
+    assert from_memory == from_file
+    assert [r['name'] for r in from_memory] == ["John Doe", "Jane Smith"]
+
+
+def test_process_html_handles_empty_content():
+    """Empty pages should produce no recruiters instead of raising"""
+    processor = HTMLProcessor()
+    assert processor.process_html("") == []
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_match_original_backend(engine):
+    """Every engine should produce exactly what the full html.parser tree produces"""
+    expected = HTMLProcessor(engine='soup').process_html(RESULTS_PAGE)
+    assert HTMLProcessor(engine=engine).process_html(RESULTS_PAGE) == expected
+
+    assert expected == [
+        {'name': 'John Doe', 'title': 'TechnicalRecruiter& Sourcer',
+         'linkedin_url': 'https://www.linkedin.com/in/johndoe'},
+        {'name': 'Jane Smith', 'title': 'University Recruiter', 'linkedin_url': '/in/janesmith'},
+    ]
+
+
+def test_dom_records_filtered_like_html():
+    """Records returned by the in-page script should be filtered the same way as parsed HTML"""
+    records = [
+        {'name': 'Krishna Sarda', 'title': '', 'profile_url': ''},
+        {'name': 'John Doe', 'title': 'TechnicalRecruiter& Sourcer',
+         'profile_url': 'https://www.linkedin.com/in/johndoe'},
+        {'name': 'LinkedIn Member', 'title': '', 'profile_url': ''},
+        {'name': 'Jane Smith', 'title': 'University Recruiter', 'profile_url': '/in/janesmith'},
+        {'name': 'John Doe', 'title': '', 'profile_url': ''},
+    ]
+    processor = HTMLProcessor(engine='soup')
+    assert processor.process_records(records) == processor.process_html(RESULTS_PAGE)
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        HTMLProcessor(engine='regex')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+import src.linkedinAutomation as automation
+import src.linkedinAutomationAsync as async_automation
+from src.utils.adaptivePacer import ChallengeError
+from src.linkedinAutomation import build_people_search_url, company_id_from_url, should_block, results_page_url
+
+
+def test_search_url_round_trips_company_id():
+    """The company ID written into a search URL should be readable back"""
+    url = build_people_search_url("Google AND technical recruiter", company_id="1441", page_num=2)
+
+    assert url.startswith("https://www.linkedin.com/search/results/people/?")
+    assert "geoUrn=%5B%22103644278%22%5D" in url
+    assert "page=2" in url
+    assert company_id_from_url(url) == "1441"
+
+
+def test_company_id_missing_from_unfiltered_url():
+    assert company_id_from_url(build_people_search_url("Google")) is None
+
+
+def test_results_page_url_replaces_page_param():
+    url = results_page_url(build_people_search_url("Google", company_id="1441", page_num=2), 5)
+
+    assert "page=5" in url
+    assert "page=2" not in url
+    assert company_id_from_url(url) == "1441"
+
+
+def test_company_id_cache(tmp_path, monkeypatch):
+    """Resolved IDs should be cached by case-insensitive company name"""
+    monkeypatch.setattr(automation, "COMPANY_ID_CACHE", str(tmp_path / "cache" / "company_ids.json"))
+
+    assert automation.get_cached_company_id("Google") is None
+    automation.cache_company_id("Google", "1441")
+    assert automation.get_cached_company_id(" google ") == "1441"
+
+
+@pytest.mark.parametrize("resource_type, url, blocked", [
+    ("document", "https://www.linkedin.com/search/results/people/", False),
+    ("script", "https://static.licdn.com/aero-v1/sc/h/app.js", False),
+    ("image", "https://media.licdn.com/dms/image/profile.jpg", True),
+    ("font", "https://static.licdn.com/fonts/font.woff2", True),
+    ("script", "https://www.google-analytics.com/analytics.js", True),
+    ("xhr", "https://evil-linkedin.com/track", True),
+])
+def test_scraping_profile_blocking(resource_type, url, blocked):
+    assert should_block(resource_type, url, allowlist=[]) is blocked
+
+
+def test_allowlist_overrides_blocking():
+    assert not should_block("image", "https://media.licdn.com/needed.png", allowlist=["needed.png"])
+
+
+class FakeChallengedPage:
+    """Async page stand-in that shows a CAPTCHA for the first few checks"""
+
+    url = "https://www.linkedin.com/search/results/people/"
+
+    def __init__(self, checks_until_cleared):
+        self.checks = checks_until_cleared
+        self.visited = []
+
+    async def query_selector(self, selector):
+        self.checks -= 1
+        return object() if self.checks >= 0 else None
+
+    async def goto(self, url):
+        self.visited.append(url)
+
+
+def test_async_challenge_waits_for_cooldown(monkeypatch):
+    monkeypatch.setattr(async_automation, "CHALLENGE_POLL_INTERVAL", 0)
+    monkeypatch.setattr(async_automation.pacer, "challenge_cooldown", 60)
+
+    page = FakeChallengedPage(checks_until_cleared=3)
+    assert asyncio.run(async_automation.guard_challenge(page, "https://example.com/page2"))
+    assert page.visited == ["https://example.com/page2"]
+
+    monkeypatch.setattr(async_automation.pacer, "challenge_cooldown", 0)
+    with pytest.raises(ChallengeError):
+        asyncio.run(async_automation.guard_challenge(FakeChallengedPage(checks_until_cleared=100)))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -112,5 +112,40 @@ def test_specific_cases():
         assert result == expected, f"Failed for input: {input_name}"
 
 
+def test_decorated_names():
+    """Emoji and styled Unicode letters in display names should not end up in the name"""
+    assert NameCleaner.clean_name("𝐉𝐚𝐧𝐞 𝐃𝐨𝐞 🚀")['full_name'] == "Jane Doe"
+    assert NameCleaner.clean_name("Sam Lee ✨ is hiring")['full_name'] == "Sam Lee"
+    assert NameCleaner.clean_name("Ana⭐️Lopez (she/her)")['full_name'] == "Ana Lopez"
+    assert NameCleaner.clean_name("🇺🇸 👩‍💻") is None
+
+
+def test_symbols_are_not_folded_into_names():
+    """Trademark, numbered and Roman numeral symbols are dropped, not turned into letters and digits"""
+    assert NameCleaner.clean_name("Jane Smith™")['full_name'] == "Jane Smith"
+    assert NameCleaner.clean_name("Jane Smith ②")['full_name'] == "Jane Smith"
+    assert NameCleaner.clean_name("Jane® Smith")['full_name'] == "Jane Smith"
+    assert NameCleaner.clean_name("John Smith Ⅲ") == NameCleaner.clean_name("John Smith")
+    assert NameCleaner.clean_name("John Ⅲ Smith")['full_name'] == "John Smith"
+    # Letterlike and circled letters still spell the name
+    assert NameCleaner.clean_name("Ⓙⓐⓝⓔ 𝒮𝓂𝒾𝓉𝒽 ℯ")['full_name'] == "Jane Smith e"
+
+
+def test_batch_cleaning_matches_per_row():
+    """clean_names and clean_titles should give exactly what the per-row API gives"""
+    names = ["Teju K is hiring", "Ritika Jain, PHR, SHRM-CP", "Creator", "Nitya Kohli (she/her)",
+             "José María García", "Anna Lee MBA open to work", "  ", None, "Teju K is hiring", "A B C D",
+             "𝐉𝐚𝐧𝐞 𝐃𝐨𝐞 🚀", "👩‍💻 Priya S. Rao",
+             "Jane Smith™", "Jane Smith ②", "John Smith Ⅲ", "John Ⅲ Smith"]
+    titles = ["3rd+ 3rd+ Technical Recruiter", "Recruiter | Hiring now", None, " Talent Partner "]
+
+    batch = NameCleaner.clean_names(pd.Series(names))
+    for name, (_, row) in zip(names, batch.iterrows()):
+        expected = NameCleaner.clean_name(name)
+        assert (row.to_dict() if row['full_name'] is not None else None) == expected, name
+
+    assert NameCleaner.clean_titles(titles).tolist() == [NameCleaner.clean_title(t) for t in titles]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -0,0 +1,32 @@
+import pytest
+from src.pageCorpus import PageCorpus
+
+
+def test_record_and_load_round_trip(tmp_path):
+    """A recorded snapshot should load back exactly as captured"""
+    corpus = PageCorpus(str(tmp_path / "corpus"))
+    corpus.record("<html>page one</html>", "TestCompany", "technical recruiter", 1, pdf=b"%PDF-1.4")
+
+    entries = list(corpus.entries())
+    assert len(entries) == 1
+    assert entries[0]['company'] == "TestCompany"
+
+    snapshot = corpus.load(entries[0])
+    assert snapshot == {'role': "technical recruiter", 'page_num': 1,
+                        'html': "<html>page one</html>", 'pdf': b"%PDF-1.4"}
+
+
+def test_identical_pages_share_objects(tmp_path):
+    """Content addressing should store repeated pages once"""
+    root = tmp_path / "corpus"
+    corpus = PageCorpus(str(root))
+    first = corpus.record("<html>same</html>", "A", "technical recruiter", 1)
+    second = corpus.record("<html>same</html>", "B", "university recruiter", 3)
+
+    assert first['html'] == second['html']
+    assert len(list((root / "objects").rglob("*.gz"))) == 1
+    assert [e['company'] for e in corpus.entries("b")] == ["B"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,44 @@
+import pdfplumber
+import pytest
+from src.pdf_parser import PDFProcessor
+
+# Page 1: a header and a sidebar block around three results, the first one drawn
+# out of order and 1pt off the baseline. Page 2: one more result.
+RESULTS_PDF = "tests/data/pdf/results_page.pdf"
+
+
+def test_results_lines_ignore_header_and_sidebar():
+    with pdfplumber.open(RESULTS_PDF) as pdf:
+        lines = PDFProcessor()._results_lines(pdf.pages[0])
+
+    assert lines == ['Jane Smith • Technical Recruiter at Acme',
+                     'Raj Patel • University Recruiter',
+                     'LinkedIn Member • Recruiter']
+
+
+def test_find_titles_from_path_and_bytes():
+    with open(RESULTS_PDF, 'rb') as f:
+        pdf_bytes = f.read()
+
+    for source in (RESULTS_PDF, pdf_bytes):
+        titles = PDFProcessor().find_titles(source, ['Raj Patel', 'Ana Lima', 'LinkedIn Member'])
+        assert titles == {'Raj Patel': 'University Recruiter', 'Ana Lima': 'Sourcer'}
+
+
+def test_find_titles_stops_once_all_names_resolved(monkeypatch):
+    scanned = []
+    results_lines = PDFProcessor._results_lines
+
+    def counting(self, page):
+        scanned.append(page.page_number)
+        return results_lines(self, page)
+
+    monkeypatch.setattr(PDFProcessor, '_results_lines', counting)
+    titles = PDFProcessor().find_titles(RESULTS_PDF, ['Jane Smith'])
+
+    assert titles == {'Jane Smith': 'Technical Recruiter at Acme'}
+    assert scanned == [1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
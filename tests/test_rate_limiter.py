@@ -0,0 +1,64 @@
+import threading
+from src.utils.rateLimiter import TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_waits_for_the_tightest_budget():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter({'minute': (50, 60), 'hour': (200, 3600)}, clock=clock, sleep=clock.sleep)
+
+    for _ in range(50):
+        assert limiter.acquire()
+    assert clock.now == 0
+
+    # The 51st request waits for the minute bucket to refill one token
+    assert limiter.acquire()
+    assert abs(clock.now - 1.2) < 1e-9
+
+
+def test_max_wait_and_reported_usage():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter({'minute': (50, 60), 'day': (600, 86400)}, clock=clock, sleep=clock.sleep)
+
+    limiter.observe_usage({'day': 600, 'minute': 3})
+    assert limiter.acquire(max_wait=60) is False
+    assert clock.now == 0
+    assert abs(limiter.wait_time() - 144) < 1e-9
+
+    assert limiter.acquire()
+    assert abs(clock.now - 144) < 1e-9
+
+
+def test_throttle_empties_a_bucket():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter({'minute': (50, 60), 'hour': (200, 3600)}, clock=clock, sleep=clock.sleep)
+
+    limiter.throttle('minute')
+    assert abs(limiter.wait_time() - 1.2) < 1e-9
+    assert limiter.tokens['hour'] == 200
+
+
+def test_stop_interrupts_a_long_wait():
+    clock = FakeClock()
+    stop = threading.Event()
+
+    def sleep(seconds):
+        clock.sleep(seconds)
+        stop.set()
+
+    limiter = TokenBucketLimiter({'day': (600, 86400)}, clock=clock, sleep=sleep)
+    limiter.observe_usage({'day': 600})
+
+    # The next token is 144s away, but the wait is sliced and gives up once stop is set
+    assert limiter.acquire(stop=stop) is False
+    assert clock.now == 1.0
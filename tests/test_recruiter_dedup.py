@@ -0,0 +1,73 @@
+import pandas as pd
+from src.utils.recruiterDedup import RecruiterDedupIndex, dedupe_recruiters, soundex, fold
+
+
+def test_keys():
+    assert fold("Jáne-Marie") == "janemarie"
+    assert soundex("robert") == soundex("rupert") == "R163"
+    assert soundex("ashcraft") == "A261"
+
+
+def test_name_variants_are_one_person():
+    index = RecruiterDedupIndex()
+    assert index.add("Jane", "", "Smith") is None
+    assert index.add("Jane", "A.", "Smith") == 0
+    assert index.add("Jáne", "", "Smith") == 0
+    assert index.add("Jon", "", "Smith") is None
+    assert index.add("John", "", "Smith") == 1
+    assert index.add("Jane", "B.", "Smyth") is None
+
+
+def test_full_middle_names_must_match():
+    index = RecruiterDedupIndex()
+    assert index.add("Jane", "P1", "Smith") is None
+    assert index.add("Jane", "P2", "Smith") is None
+    assert index.add("Jane", "Paula", "Smith") is None
+    assert index.add("Jane", "P.", "Smith") == 0
+
+
+def test_profile_urls_decide():
+    index = RecruiterDedupIndex()
+    index.add("Jane", "", "Smith", "https://www.linkedin.com/in/janesmith/?miniProfile=1")
+    assert index.add("Jane", "", "Smith", "https://www.linkedin.com/in/jane-smith-2") is None
+    assert index.add("J", "", "S", "https://linkedin.com/in/JaneSmith") == 0
+
+
+def test_dedupe_fills_blanks_and_skips_stored():
+    df = pd.DataFrame({
+        'Full Name': ['Jane Smith', 'Jane A. Smith', 'Raj Patel'],
+        'First Name': ['Jane', 'Jane', 'Raj'],
+        'Middle Name': ['', 'A.', ''],
+        'Last Name': ['Smith', 'Smith', 'Patel'],
+        'Title': ['', 'Recruiter', 'Sourcer'],
+        'LinkedIn URL': ['', '', '']
+    })
+
+    deduped = dedupe_recruiters(df)
+    assert list(deduped['Full Name']) == ['Jane Smith', 'Raj Patel']
+    assert deduped.iloc[0]['Title'] == 'Recruiter'
+
+    stored = pd.DataFrame({'First Name': ['Raj'], 'Last Name': ['Patel']})
+    assert list(dedupe_recruiters(df, existing=stored)['Full Name']) == ['Jane Smith']
+
+
+def test_dedupe_keeps_the_emailed_duplicate():
+    df = pd.DataFrame({
+        'Full Name': ['Jane Smith', 'Jane A. Smith'],
+        'First Name': ['Jane', 'Jane'],
+        'Middle Name': ['', 'A.'],
+        'Last Name': ['Smith', 'Smith'],
+        'Title': ['Recruiter', ''],
+        'Email': ['', 'jane@acme.com'],
+        'Email Status': ['', 'verified'],
+        'Email_Draft': ['<p>Hi Jane</p>', None],
+        'Email_Sent': [False, True],
+        'Email_Sent_Date': [None, '2024-01-02T10:00:00']
+    })
+
+    deduped = dedupe_recruiters(df)
+    assert list(deduped['Full Name']) == ['Jane A. Smith']
+    kept = deduped.iloc[0]
+    assert kept['Email_Sent'] and kept['Email_Sent_Date'] == '2024-01-02T10:00:00'
+    assert kept['Title'] == 'Recruiter'
+    assert kept['Email_Draft'] == '<p>Hi Jane</p>'
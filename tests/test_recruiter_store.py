@@ -0,0 +1,89 @@
+import pytest
+import pandas as pd
+from src.recruiterStore import RecruiterStore, columnar_path
+
+
+def test_legacy_workbook_import_and_export(tmp_path):
+    legacy = tmp_path / "recruiters.xlsx"
+    pd.DataFrame({
+        'Full Name': ['Jane Smith', 'Raj Patel'],
+        'First Name': ['Jane', 'Raj'],
+        'Last Name': ['Smith', 'Patel'],
+        'Email': ['jane@acme.com', None],
+        'Email Status': ['verified', None],
+        'Email Source': ['apollo', None],
+    }).to_excel(legacy, index=False)
+
+    store = RecruiterStore(str(tmp_path / "recruiters.db"))
+    df = store.load("Acme", legacy_path=str(legacy))
+    assert list(df['Full Name']) == ['Jane Smith', 'Raj Patel']
+    assert not df['Email_Sent'].any()
+
+    # Imported once; later loads come from the database
+    legacy.unlink()
+    assert store.full_names("Acme") == {'Jane Smith', 'Raj Patel'}
+    assert store.companies() == ['Acme']
+
+    exported = pd.read_excel(store.export("Acme", str(tmp_path / "export.xlsx")))
+    assert list(exported['Full Name']) == ['Jane Smith', 'Raj Patel']
+    assert 'Email_Sent' not in exported.columns
+
+
+def test_upsert_touches_only_given_columns(tmp_path):
+    store = RecruiterStore(str(tmp_path / "recruiters.db"))
+    store.replace("Acme", pd.DataFrame({'Full Name': ['Jane Smith'], 'Title': ['Recruiter']}))
+
+    store.upsert("Acme", pd.DataFrame({'Full Name': ['Jane Smith', 'Raj Patel'],
+                                       'Email_Draft': ['<p>Hi Jane</p>', '<p>Hi Raj</p>']}))
+
+    df = store.load("Acme").set_index('Full Name')
+    assert df.loc['Jane Smith', 'Title'] == 'Recruiter'
+    assert df.loc['Raj Patel', 'Email_Draft'] == '<p>Hi Raj</p>'
+
+    store.delete("Acme", ['Raj Patel'])
+    assert store.full_names("Acme") == {'Jane Smith'}
+
+
+def test_mark_sent_only_counts_new_sends(tmp_path):
+    store = RecruiterStore(str(tmp_path / "recruiters.db"))
+    store.replace("Acme", pd.DataFrame({'Full Name': ['Jane Smith', 'Raj Patel'],
+                                        'Email': ['jane@acme.com', 'raj@acme.com']}))
+
+    sends = {('Jane Smith', 'jane@acme.com'): '2024-01-02T10:00:00',
+             ('Jane Smith', 'old@acme.com'): '2024-01-01T10:00:00'}
+    assert store.mark_sent("Acme", sends) == 1
+    assert store.mark_sent("Acme", sends) == 0
+
+    df = store.load("Acme")
+    assert list(df['Email_Sent']) == [True, False]
+    assert df.loc[0, 'Email_Sent_Date'] == '2024-01-02T10:00:00'
+
+
+def test_summary_and_load_all(tmp_path):
+    store = RecruiterStore(str(tmp_path / "recruiters.db"))
+    store.replace("Acme", pd.DataFrame({'Full Name': ['Jane Smith', 'Raj Patel'],
+                                        'Email Source': ['apollo', 'fallback'],
+                                        'Email Status': ['verified', '']}))
+    store.replace("Globex", pd.DataFrame({'Full Name': ['Ana Lima'], 'Status': ['New']}))
+
+    assert store.summary("Acme") == {'total': 2, 'apollo': 1, 'fallback': 1, 'verified': 1, 'sent': 0}
+    assert store.summary("Missing")['total'] == 0
+
+    df = store.load_all()
+    assert len(df) == 3
+    assert df['Company'].dtype == 'category'
+    assert set(df['Company'].cat.categories) == {'Acme', 'Globex'}
+
+
+def test_export_writes_parquet_mirror(tmp_path):
+    pytest.importorskip("pyarrow")
+    store = RecruiterStore(str(tmp_path / "recruiters.db"))
+    store.replace("Acme", pd.DataFrame({'Full Name': ['Jane Smith'], 'Email Status': ['verified']}))
+
+    path = store.export("Acme", str(tmp_path / "Acme" / "recruiters.xlsx"))
+    mirror = columnar_path(path)
+    assert pd.read_parquet(mirror)['Email Status'].dtype == 'category'
+
+    # The mirror is read instead of the workbook when importing elsewhere
+    other = RecruiterStore(str(tmp_path / "other.db"))
+    assert other.import_excel("Acme", path) == 1
@@ -0,0 +1,41 @@
+from src.scrapeCheckpoint import ScrapeCheckpoint
+
+
+def test_checkpoint_resumes_after_last_page(tmp_path):
+    recruiters = {'Jane Doe': {'name': 'Jane Doe', 'title': 'Recruiter', 'linkedin_url': ''}}
+
+    checkpoint = ScrapeCheckpoint("Acme Corp", str(tmp_path))
+    checkpoint.page_done("technical recruiter", 1, recruiters)
+    checkpoint.page_done("technical recruiter", 2, recruiters)
+    checkpoint.page_done("university recruiter", 1, recruiters)
+    assert checkpoint.role_done("university recruiter", recruiters, 1)
+
+    resumed = ScrapeCheckpoint("Acme Corp", str(tmp_path))
+    assert resumed.load()
+    assert resumed.next_page("technical recruiter") == 3
+    assert resumed.next_page("university recruiter") is None
+    assert resumed.recruiters == list(recruiters.values())
+
+    resumed.clear()
+    assert not ScrapeCheckpoint("Acme Corp", str(tmp_path)).load()
+
+
+def test_new_checkpoint_starts_at_first_page(tmp_path):
+    checkpoint = ScrapeCheckpoint("Acme Corp", str(tmp_path))
+
+    assert not checkpoint.load()
+    assert checkpoint.next_page("technical recruiter") == 1
+
+
+def test_failed_page_is_not_skipped(tmp_path):
+    recruiters = {}
+    checkpoint = ScrapeCheckpoint("Acme Corp", str(tmp_path))
+    checkpoint.page_done("technical recruiter", 1, recruiters)
+    # Page 2 failed in a fetch wave while page 3 went through
+    checkpoint.page_done("technical recruiter", 3, recruiters)
+
+    assert not checkpoint.role_done("technical recruiter", recruiters, 3)
+
+    resumed = ScrapeCheckpoint("Acme Corp", str(tmp_path))
+    assert resumed.load()
+    assert resumed.next_page("technical recruiter") == 2
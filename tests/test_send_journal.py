@@ -0,0 +1,20 @@
+from src.sendJournal import SendJournal
+
+
+def test_journal_skips_partial_lines(tmp_path):
+    journal = SendJournal(str(tmp_path / "send_journal.jsonl"))
+    journal.record("Jane Smith", "jane@acme.com")
+
+    # A crash mid-append leaves a partial last line behind
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"full_name": "Raj')
+
+    assert list(SendJournal(journal.path).sent()) == [("Jane Smith", "jane@acme.com")]
+
+    # The next send starts on a fresh line
+    SendJournal(journal.path).record("Raj Patel", "raj@acme.com")
+    assert set(journal.sent()) == {("Jane Smith", "jane@acme.com"), ("Raj Patel", "raj@acme.com")}
+
+
+def test_missing_journal(tmp_path):
+    assert SendJournal(str(tmp_path / "none.jsonl")).sent() == {}
@@ -0,0 +1,31 @@
+import pytest
+from src.utils.stepTimer import StepTimer
+
+
+def test_steps_are_aggregated():
+    """Recorded latencies should be summarised per step"""
+    timer = StepTimer()
+    timer.record('search', 1.0)
+    timer.record('search', 3.0)
+    timer.record('next_page', 0.5)
+
+    report = timer.report()
+    assert report['search'] == {'count': 2, 'total': 4.0, 'mean': 2.0, 'max': 3.0}
+    assert report['next_page']['count'] == 1
+
+
+def test_step_records_even_when_block_fails():
+    """A failing step should still show up in the timing report"""
+    timer = StepTimer()
+    with pytest.raises(RuntimeError):
+        with timer.step('filter_company'):
+            raise RuntimeError("selector timed out")
+
+    assert timer.report()['filter_company']['count'] == 1
+
+    timer.reset()
+    assert timer.report() == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,57 @@
+import pytest
+from src.voyager_parser import VoyagerProcessor, is_search_results_url
+
+
+def entity_result(name, headline, slug, urn_id):
+    return {
+        "$type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+        "entityUrn": f"urn:li:fsd_entityResultViewModel:(urn:li:fsd_profile:{urn_id},SEARCH_SRP,DEFAULT)",
+        "title": {"text": name},
+        "primarySubtitle": {"text": headline},
+        "navigationUrl": f"https://www.linkedin.com/in/{slug}?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3A{urn_id}"
+    }
+
+
+@pytest.fixture
+def search_payload():
+    """Normalized search response: results in 'included', plus a non-profile result"""
+    return {
+        "data": {"searchDashClustersByAll": {"elements": []}},
+        "included": [
+            entity_result("John Doe", "Technical Recruiter at TestCompany", "johndoe", "ACoAAA1"),
+            entity_result("LinkedIn Member", "Recruiter", "headless", "ACoAAA2"),
+            {
+                "entityUrn": "urn:li:fsd_entityResultViewModel:(urn:li:fsd_company:1441,SEARCH_SRP,DEFAULT)",
+                "title": {"text": "TestCompany"},
+                "navigationUrl": "https://www.linkedin.com/company/testcompany/"
+            },
+            entity_result("Jane Smith", "University Recruiter", "janesmith", "ACoAAA3"),
+            entity_result("John Doe", "Technical Recruiter at TestCompany", "johndoe", "ACoAAA1"),
+        ]
+    }
+
+
+def test_profiles_extracted_from_payload(search_payload):
+    recruiters = VoyagerProcessor().process_payloads([search_payload])
+
+    assert recruiters == [
+        {'name': 'John Doe', 'title': 'Technical Recruiter at TestCompany',
+         'linkedin_url': 'https://www.linkedin.com/in/johndoe', 'profile_urn': 'urn:li:fsd_profile:ACoAAA1'},
+        {'name': 'Jane Smith', 'title': 'University Recruiter',
+         'linkedin_url': 'https://www.linkedin.com/in/janesmith', 'profile_urn': 'urn:li:fsd_profile:ACoAAA3'},
+    ]
+
+
+def test_empty_payloads():
+    assert VoyagerProcessor().process_payloads([{}, {"included": []}]) == []
+
+
+def test_search_results_url_detection():
+    assert is_search_results_url(
+        "https://www.linkedin.com/voyager/api/graphql?variables=(start:10)&queryId=voyagerSearchDashClusters.abc")
+    assert not is_search_results_url(
+        "https://www.linkedin.com/voyager/api/graphql?queryId=voyagerSearchDashReusableTypeahead.abc")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v'])